@@ -2,19 +2,23 @@ from typing import Dict, List
 from .base_extractor import BaseExtractor
 import asyncio
 from datetime import datetime
-from utils.excel_generator import ExcelGenerator
+from utils import scrape_cache
 
 class AmazonExtractor(BaseExtractor):
     async def extract(self, base_url: str, max_pages: int = 2) -> List[Dict]:
+        # Recent result on disk beats a fresh Playwright round-trip
+        cached = scrape_cache.get(base_url, self.cache_ttl_hours)
+        if cached is not None:
+            print(f"Using cached jobs for {base_url}")
+            return cached
+
         try:
-            # Create new page with custom headers
-            context = await self.scraper.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/91.0.4472.124 Safari/537.36'
-            )
-            page = await context.new_page()
-            
+            # Reuse the shared context (resource blocking already applied)
+            # instead of paying context startup per URL
+            page = await self.scraper.get_page()
+
             all_jobs = []
+            seen_urls = set()
             current_page = 1
 
             # Initial page load with retries
@@ -56,11 +60,18 @@ class AmazonExtractor(BaseExtractor):
                     }
                 """)
                 
-                # Add new jobs to the list and CSV file
+                # Add new jobs to the list and CSV file, deduping on URL
+                # via set lookup instead of scanning the whole list per job
+                new_jobs = []
                 for job in jobs:
-                    if job not in all_jobs:  # Avoid duplicates
-                        all_jobs.append(job)
-                        print(f"Found: {job['title']} - {job['location']}")
+                    key = job.get('url') or job.get('link')
+                    if key in seen_urls:
+                        continue
+                    seen_urls.add(key)
+                    new_jobs.append(job)
+                    print(f"Found: {job['title']} - {job['location']}")
+
+                all_jobs.extend(new_jobs)
                 
                 if current_page >= max_pages:
                     break
@@ -69,8 +80,14 @@ class AmazonExtractor(BaseExtractor):
                 try:
                     next_button = await page.wait_for_selector('[aria-label*="Next"]', timeout=5000)
                     if next_button and await next_button.is_visible():
+                        # Snapshot the first tile so we can wait for the
+                        # listing to change instead of sleeping a fixed 2s
+                        old_url = await page.evaluate(
+                            "() => document.querySelector('.job-tile a')?.href || ''")
                         await next_button.click()
-                        await asyncio.sleep(2)  # Wait for page load
+                        await page.wait_for_function(
+                            "(u) => (document.querySelector('.job-tile a')?.href || '') !== u",
+                            arg=old_url, timeout=15000)
                         current_page += 1
                     else:
                         print("No more pages available")
@@ -81,11 +98,9 @@ class AmazonExtractor(BaseExtractor):
             
             await page.close()
             print(f"\nTotal Amazon jobs found: {len(all_jobs)}")
-            
-            # Add jobs to Excel/CSV
-            excel_gen = ExcelGenerator()
-            excel_gen.append_jobs(all_jobs, "Amazon")
-            
+            if all_jobs:
+                scrape_cache.put(base_url, all_jobs)
+
             return all_jobs
             
         except Exception as e:
@@ -103,30 +118,16 @@ def extract(scraper, base_url: str) -> List[Dict]:
     Returns:
         List of job dictionaries containing title, location, and link
     """
-    jobs = []
     page = scraper.get_page(base_url)
-    amazon_selectors = {
-        'job_container': '.job-tile',
-        'title': 'h3', 
-        'location': '.location-text',
-        'url': 'a',
-        'next_page': '[data-action="pagination-next-page"]'
-    }
-
-    # Wait for job container elements to load
-    job_elements = page.query_selector_all(amazon_selectors['job_container'])
-
-    # Extract job information from each container
-    for job in job_elements:
-        title = job.query_selector(amazon_selectors['title'])
-        location = job.query_selector(amazon_selectors['location']) 
-        url = job.query_selector(amazon_selectors['url'])
 
-        if title and location and url:
-            job_data = {
-                'title': title.inner_text(),
-                'location': location.inner_text(),
-                'link': url.get_attribute('href')
-            }
-            jobs.append(job_data)
-    return jobs 
\ No newline at end of file
+    # One evaluate returns the whole array instead of paying a CDP
+    # round-trip per inner_text/get_attribute call per tile
+    return page.evaluate("""
+        () => [...document.querySelectorAll('.job-tile')]
+            .map(tile => ({
+                title: tile.querySelector('h3')?.innerText.trim(),
+                location: tile.querySelector('.location-text')?.innerText.trim() || '',
+                link: tile.querySelector('a')?.href
+            }))
+            .filter(job => job.title && job.link)
+    """) 
\ No newline at end of file
@@ -2,13 +2,105 @@ from abc import ABC, abstractmethod
 from typing import List, Dict, Tuple
 from utils.html_cleaner import clean_html
 import asyncio
+import os
 import re
 import json
 from datetime import datetime
 
+# Extraction JS kept at module scope so the formatted source is built once
+# per extractor instance and the browser can cache-compile it
+_EXTRACT_JOBS_JS = """
+    () => {
+        // Map keyed on href dedupes without JSON round-trips
+        const jobs = new Map();
+        const containerClasses = %(container_classes)s;
+        const containerTags = %(container_tags)s;
+        const joinedComplexContainers = %(complex_containers)s;
+        const joinedFallbackContainers = %(fallback_containers)s;
+        const joinedTitles = %(titles)s;
+        const joinedLocations = %(locations)s;
+        const joinedLinks = %(links)s;
+
+        // Fast paths for plain class/tag selectors; joined
+        // querySelectorAll only for the attribute selectors
+        const seen = new Set();
+        const jobElements = [];
+        const collect = (collection) => {
+            // Hoist length: HTMLCollection length is a getter per read
+            for (let i = 0, n = collection.length; i < n; i++) {
+                const el = collection[i];
+                if (!seen.has(el)) {
+                    seen.add(el);
+                    jobElements.push(el);
+                }
+            }
+        };
+        for (const name of containerClasses) {
+            collect(document.getElementsByClassName(name));
+        }
+        for (const tag of containerTags) {
+            collect(document.getElementsByTagName(tag));
+        }
+        if (joinedComplexContainers) {
+            try {
+                collect(document.querySelectorAll(joinedComplexContainers));
+            } catch (e) {
+                console.error('Error querying containers:', e);
+            }
+        }
+        // Catch-alls only when the specific selectors came up empty
+        if (jobElements.length === 0 && joinedFallbackContainers) {
+            try {
+                collect(document.querySelectorAll(joinedFallbackContainers));
+            } catch (e) {
+                console.error('Error querying fallback containers:', e);
+            }
+        }
+
+        for (let i = 0, n = jobElements.length; i < n; i++) {
+            const container = jobElements[i];
+            try {
+                // Single joined query instead of a per-selector loop
+                let link = container.querySelector(joinedLinks);
+
+                // If no link found, check if container itself is a link
+                if (!link?.href && container.tagName === 'A') {
+                    link = container;
+                }
+
+                if (link?.href) {
+                    const title =
+                        container.querySelector(joinedTitles)?.textContent ||
+                        link.textContent;
+
+                    const location =
+                        container.querySelector(joinedLocations)?.textContent ||
+                        '';
+
+                    if (title?.trim() && !jobs.has(link.href)) {
+                        jobs.set(link.href, {
+                            url: link.href,
+                            title: title.trim(),
+                            location: location?.trim() || ''
+                        });
+                    }
+                }
+            } catch (e) {
+                console.error('Error processing container:', e);
+            }
+        }
+
+        // Readiness rides along with the extraction so Python needs no
+        // separate liveness probe round-trip
+        const ready = jobElements.length > 0 || document.readyState === 'complete';
+        return { ready, jobs: Array.from(jobs.values()) };
+    }
+"""
+
 class BaseExtractor(ABC):
     def __init__(self, scraper):
         self.scraper = scraper
+        self._error_count = 0
         # Common selectors found across job sites
         self.selectors = {
             'containers': [
@@ -83,6 +175,45 @@ class BaseExtractor(ABC):
                 'a[href*="career-search"]'
             ]
         }
+        # Pre-joined selector strings so the in-page JS can do a single
+        # querySelector per category instead of one DOM traversal per selector
+        self.joined_containers = ','.join(self.selectors['containers'])
+        # Partition container selectors so the page JS can use the fast
+        # getElementsByClassName/TagName paths for plain class/tag selectors
+        # and fall back to one joined querySelectorAll for the rest.
+        # Catch-alls match thousands of nodes on marketing-heavy pages, so
+        # they are only queried when the specific selectors find nothing
+        catch_alls = {'div[class*="job"]', 'div[class*="career"]',
+                      'div[class*="position"]', 'article'}
+        self.container_classes = []
+        self.container_tags = []
+        complex_containers = []
+        fallback_containers = []
+        for selector in self.selectors['containers']:
+            if selector in catch_alls:
+                fallback_containers.append(selector)
+            elif re.fullmatch(r'\.[\w-]+', selector):
+                self.container_classes.append(selector[1:])
+            elif re.fullmatch(r'[a-zA-Z]+', selector):
+                self.container_tags.append(selector)
+            else:
+                complex_containers.append(selector)
+        self.joined_complex_containers = ','.join(complex_containers)
+        self.joined_fallback_containers = ','.join(fallback_containers)
+        self.joined_titles = ','.join(self.selectors['title_selectors'])
+        self.joined_locations = ','.join(self.selectors['location_selectors'])
+        self.joined_links = ','.join(self.selectors['link_selectors'])
+        # Format the extraction JS once so per-page calls skip json.dumps
+        # and template interpolation entirely
+        self._extract_jobs_js = _EXTRACT_JOBS_JS % {
+            'container_classes': json.dumps(self.container_classes),
+            'container_tags': json.dumps(self.container_tags),
+            'complex_containers': json.dumps(self.joined_complex_containers),
+            'fallback_containers': json.dumps(self.joined_fallback_containers),
+            'titles': json.dumps(self.joined_titles),
+            'locations': json.dumps(self.joined_locations),
+            'links': json.dumps(self.joined_links),
+        }
 
     async def extract(self, base_url: str, max_pages: int = 2) -> List[Dict]:
         """
@@ -93,19 +224,10 @@ class BaseExtractor(ABC):
             max_pages: Maximum number of pages to scrape
         """
         try:
-            context = await self.scraper.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                # Add additional headers to appear more like a real browser
-                extra_http_headers={
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5',
-                    'Connection': 'keep-alive',
-                }
-            )
-            
-            page = await context.new_page()
-            
+            # Reuse the shared context (resource blocking already applied)
+            # instead of paying context startup per URL
+            page = await self.scraper.get_page()
+
             # Increase default timeout
             page.set_default_timeout(60000)  # 60 seconds
             
@@ -174,235 +296,173 @@ class BaseExtractor(ABC):
         except Exception as e:
             print(f"Error extracting jobs: {str(e)}")
             if 'page' in locals():
-                try:
-                    # Take screenshot on error for debugging
-                    await page.screenshot(path=f'error_screenshot_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png')
-                    print("Error screenshot saved")
-                except:
-                    pass
+                # Screenshots are opt-in and capped: encoding a full-page
+                # PNG per transient failure slows batch crawls and litters
+                # the working directory
+                if os.environ.get('SCRAPER_DEBUG_SCREENSHOTS') and self._error_count < 3:
+                    try:
+                        await page.screenshot(
+                            path=f'error_screenshot_{datetime.now().strftime("%Y%m%d_%H%M%S")}.jpg',
+                            type='jpeg', quality=60)
+                        self._error_count += 1
+                        print("Error screenshot saved")
+                    except:
+                        pass
                 await page.close()
             return []
 
     async def extract_job_links(self, page):
         """Enhanced job extraction with intelligent selectors"""
         try:
-            # Add delay to ensure page is fully loaded
-            await asyncio.sleep(2)
-            
-            # Check if page is loaded properly
-            if not await self.scraper.wait_for_page_load(page):
-                print("Page not loaded properly, retrying...")
-                await page.reload()
-                await asyncio.sleep(5)
-                if not await self.scraper.wait_for_page_load(page):
-                    print("Page still not loaded properly after retry")
-                    return []
-
-            # Convert selectors lists to JavaScript arrays
-            containers_js = json.dumps(self.selectors['containers'])
-            titles_js = json.dumps(self.selectors['title_selectors'])
-            locations_js = json.dumps(self.selectors['location_selectors'])
-            links_js = json.dumps(self.selectors['link_selectors'])
+            # The evaluate doubles as the readiness probe: retry with
+            # exponential backoff only while the page reports not-ready
+            # and extraction came back empty
+            delay = 1
+            for attempt in range(3):
+                result = await page.evaluate(self._extract_jobs_js)
+                if result['ready'] or result['jobs']:
+                    return result['jobs']
+                print(f"Page not ready, retrying in {delay}s...")
+                await asyncio.sleep(delay)
+                delay *= 2
+            return result['jobs']
 
-            jobs = await page.evaluate(f"""
-                () => {{
-                    const jobs = new Set();
-                    const containers = {containers_js};
-                    const titleSelectors = {titles_js};
-                    const locationSelectors = {locations_js};
-                    const linkSelectors = {links_js};
-                    
-                    const safeQuerySelector = (element, selectors) => {{
-                        for (const selector of selectors) {{
-                            try {{
-                                const found = element.querySelector(selector);
-                                if (found) return found;
-                            }} catch {{
-                                continue;
-                            }}
-                        }}
-                        return null;
-                    }};
-                    
-                    const findJobElements = () => {{
-                        let elements = [];
-                        for (const selector of containers) {{
-                            try {{
-                                elements = [...elements, ...document.querySelectorAll(selector)];
-                            }} catch {{
-                                continue;
-                            }}
-                        }}
-                        return elements;
-                    }};
-                    
-                    const jobElements = findJobElements();
-                    
-                    jobElements.forEach(container => {{
-                        try {{
-                            let link = null;
-                            // Try finding link in container first
-                            for (const linkSelector of linkSelectors) {{
-                                link = safeQuerySelector(container, [linkSelector]);
-                                if (link?.href) break;
-                            }}
-                            
-                            // If no link found, check if container itself is a link
-                            if (!link?.href && container.tagName === 'A') {{
-                                link = container;
-                            }}
-                                
-                            if (link?.href) {{
-                                const title = 
-                                    safeQuerySelector(container, titleSelectors)?.textContent ||
-                                    link.textContent;
-                                    
-                                const location = 
-                                    safeQuerySelector(container, locationSelectors)?.textContent ||
-                                    '';
-                                
-                                if (title?.trim()) {{
-                                    jobs.add(JSON.stringify({{
-                                        url: link.href,
-                                        title: title.trim(),
-                                        location: location?.trim() || ''
-                                    }}));
-                                }}
-                            }}
-                        }} catch (e) {{
-                            console.error('Error processing container:', e);
-                        }}
-                    }});
-                    
-                    return Array.from(jobs).map(job => JSON.parse(job));
-                }}
-            """)
-            
-            return jobs
-            
         except Exception as e:
             print(f"Error in job extraction: {str(e)}")
             return []
 
+    # Next-page controls tried in priority order; folded into one joined
+    # query at class-definition time
+    next_page_selectors = [
+        # Standard next buttons
+        '[aria-label*="Next"]',
+        '[aria-label*="next"]',
+        '[class*="next"]',
+        '[class*="Next"]',
+        'a[rel="next"]',
+        '.next-page',
+        '.nextPage',
+        '.pagination__next',
+        
+        # Button-specific selectors
+        'button[aria-label*="next"]',
+        'button[aria-label*="Next"]',
+        'button[class*="next"]',
+        'button[class*="Next"]',
+        'button.next',
+        'button.Next',
+        '[data-action*="next"]',
+        '[data-action*="Next"]',
+        
+        # Common pagination patterns
+        '.pagination li:last-child a',
+        '.pagination__next a',
+        '[class*="pagination-next"]',
+        '[class*="pager-next"]',
+        '.next-link',
+        
+        # Icon/Arrow based selectors
+        '[class*="arrow-next"]',
+        '[class*="arrow_next"]',
+        '[class*="chevron-right"]',
+        '[aria-label="Forward"]',
+        '[aria-label="Next Page"]',
+        
+        # Form-based pagination (like Apple)
+        '#frmPagination',
+        'form[id*="pagination"]',
+        'form[class*="pagination"]',
+        
+        # Data attribute patterns
+        '[data-page="next"]',
+        '[data-navigation="next"]',
+        '[data-test*="next"]',
+        '[data-testid*="next"]',
+        
+        # Common class name patterns
+        '.load-more',
+        '.loadMore',
+        '.show-more',
+        '.showMore',
+        
+        # SVG/Icon containers
+        '[class*="next-icon"]',
+        '[class*="nextIcon"]',
+        '.icon-next',
+        '.iconNext',
+        
+        # Specific vendor patterns
+        '[class*="pagination-next"]',
+        '[class*="pager-next"]',
+        '[class*="paginate-next"]',
+        
+        # URL patterns
+        'a[href*="page="]',
+        'a[href*="pageNumber="]',
+        'a[href*="pageNum="]',
+        
+        # ARIA patterns
+        '[role="button"][aria-label*="next"]',
+        '[role="button"][aria-label*="Next"]',
+        '[aria-controls*="pagination"]'
+    ]
+
+    _next_joined = ','.join(next_page_selectors)
+
+    # Accessible-name match replacing the old jQuery-only a:contains(...)
+    # entries, which Chromium's querySelector cannot parse
+    _next_text_pattern = re.compile(r'next|show more', re.I)
+
     async def try_next_page(self, page) -> bool:
-        """Try different methods to find and click next page button"""
-        next_page_selectors = [
-            # Standard next buttons
-            '[aria-label*="Next"]',
-            '[aria-label*="next"]',
-            '[class*="next"]',
-            '[class*="Next"]',
-            'a[rel="next"]',
-            '.next-page',
-            '.nextPage',
-            '.pagination__next',
-            
-            # Button-specific selectors
-            'button[aria-label*="next"]',
-            'button[aria-label*="Next"]',
-            'button[class*="next"]',
-            'button[class*="Next"]',
-            'button.next',
-            'button.Next',
-            '[data-action*="next"]',
-            '[data-action*="Next"]',
-            
-            # Common pagination patterns
-            '.pagination li:last-child a',
-            '.pagination__next a',
-            '[class*="pagination-next"]',
-            '[class*="pager-next"]',
-            '.next-link',
-            
-            # Icon/Arrow based selectors
-            '[class*="arrow-next"]',
-            '[class*="arrow_next"]',
-            '[class*="chevron-right"]',
-            '[aria-label="Forward"]',
-            '[aria-label="Next Page"]',
-            
-            # Form-based pagination (like Apple)
-            '#frmPagination',
-            'form[id*="pagination"]',
-            'form[class*="pagination"]',
-            
-            # Common text patterns
-            'a:contains("Next")',
-            'a:contains("next")',
-            'a:contains("Next Page")',
-            'a:contains("Show More")',
-            
-            # Data attribute patterns
-            '[data-page="next"]',
-            '[data-navigation="next"]',
-            '[data-test*="next"]',
-            '[data-testid*="next"]',
-            
-            # Common class name patterns
-            '.load-more',
-            '.loadMore',
-            '.show-more',
-            '.showMore',
-            
-            # SVG/Icon containers
-            '[class*="next-icon"]',
-            '[class*="nextIcon"]',
-            '.icon-next',
-            '.iconNext',
-            
-            # Specific vendor patterns
-            '[class*="pagination-next"]',
-            '[class*="pager-next"]',
-            '[class*="paginate-next"]',
-            
-            # URL patterns
-            'a[href*="page="]',
-            'a[href*="pageNumber="]',
-            'a[href*="pageNum="]',
-            
-            # ARIA patterns
-            '[role="button"][aria-label*="next"]',
-            '[role="button"][aria-label*="Next"]',
-            '[aria-controls*="pagination"]'
-        ]
+        """Find and activate the next-page control with a single DOM query"""
+        # One evaluate over the joined selector replaces ~50 sequential
+        # query_selector/is_visible round-trips; the first visible match
+        # is followed (links) or clicked (buttons) in-page
+        try:
+            target = await page.evaluate("""
+                (sel) => {
+                    let els;
+                    try {
+                        els = document.querySelectorAll(sel);
+                    } catch (e) {
+                        return null;
+                    }
+                    for (const el of els) {
+                        const rect = el.getBoundingClientRect();
+                        if (rect.width > 0 && rect.height > 0) {
+                            if (el.href) {
+                                return { href: el.href };
+                            }
+                            el.click();
+                            return { href: null };
+                        }
+                    }
+                    return null;
+                }
+            """, self._next_joined)
+        except Exception:
+            return False
 
-        # Additional form-based pagination selectors
-        pagination_form_selectors = {
-            'form': [
-                '#frmPagination',
-                'form[id*="pagination"]',
-                'form[class*="pagination"]',
-                '.pagination__mid form'
-            ],
-            'input': [
-                '#page-number',
-                'input[name*="page"]',
-                'input[id*="page"]',
-                '[type="text"][name*="page"]'
-            ],
-            'total_pages': [
-                '.pageNumber:last-child',
-                '[class*="total-pages"]',
-                '[class*="page-count"]',
-                'span:contains("of")+span'
-            ]
-        }
-        
-        for selector in next_page_selectors:
+        if target is None:
+            # Text-labelled controls ('Next', 'Show More') have no stable
+            # class/attribute; match them by accessible name instead
             try:
-                next_button = await page.query_selector(selector)
-                if next_button and await next_button.is_visible():
-                    # Check if it's a link or button
-                    if await next_button.get_attribute('href'):
-                        await page.goto(await next_button.get_attribute('href'))
-                    else:
-                        await next_button.click()
-                    await page.wait_for_load_state('networkidle')
-                    return True
-            except:
-                continue
-        
-        return False
+                locator = page.get_by_role('link', name=self._next_text_pattern).first
+                href = await locator.evaluate('el => el.href', timeout=2000)
+                if href:
+                    target = {'href': href}
+            except Exception:
+                pass
+        if target is None:
+            return False
+
+        try:
+            if target['href']:
+                await page.goto(target['href'])
+            await page.wait_for_load_state('domcontentloaded')
+            return True
+        except Exception:
+            return False
 
     async def clean_job_description(self, html: str) -> str:
         """Clean job description HTML"""
@@ -1,132 +1,341 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Tuple
+from typing import AsyncIterator, List, Dict, Tuple
 from utils.html_cleaner import clean_html
+from utils import scrape_cache
+import aiohttp
 import asyncio
+import os
 import re
 import json
+from bs4 import BeautifulSoup
 from datetime import datetime
+from urllib.parse import urljoin, urlparse
+
+try:
+    import orjson
+
+    def _json_dumps(value):
+        return orjson.dumps(value).decode()
+except ImportError:  # stdlib fallback keeps orjson optional
+    _json_dumps = json.dumps
+
+
+# Next-page controls tried in priority order; joined into one query at init
+NEXT_PAGE_SELECTORS = [
+    # Standard next buttons
+    '[aria-label*="Next"]',
+    '[aria-label*="next"]',
+    '[class*="next"]',
+    '[class*="Next"]',
+    'a[rel="next"]',
+    '.next-page',
+    '.nextPage',
+    '.pagination__next',
+    
+    # Button-specific selectors
+    'button[aria-label*="next"]',
+    'button[aria-label*="Next"]',
+    'button[class*="next"]',
+    'button[class*="Next"]',
+    'button.next',
+    'button.Next',
+    '[data-action*="next"]',
+    '[data-action*="Next"]',
+    
+    # Common pagination patterns
+    '.pagination li:last-child a',
+    '.pagination__next a',
+    '[class*="pagination-next"]',
+    '[class*="pager-next"]',
+    '.next-link',
+    
+    # Icon/Arrow based selectors
+    '[class*="arrow-next"]',
+    '[class*="arrow_next"]',
+    '[class*="chevron-right"]',
+    '[aria-label="Forward"]',
+    '[aria-label="Next Page"]',
+    
+    # Form-based pagination (like Apple)
+    '#frmPagination',
+    'form[id*="pagination"]',
+    'form[class*="pagination"]',
+    
+    # Data attribute patterns
+    '[data-page="next"]',
+    '[data-navigation="next"]',
+    '[data-test*="next"]',
+    '[data-testid*="next"]',
+    
+    # Common class name patterns
+    '.load-more',
+    '.loadMore',
+    '.show-more',
+    '.showMore',
+    
+    # SVG/Icon containers
+    '[class*="next-icon"]',
+    '[class*="nextIcon"]',
+    '.icon-next',
+    '.iconNext',
+    
+    # Specific vendor patterns
+    '[class*="pagination-next"]',
+    '[class*="pager-next"]',
+    '[class*="paginate-next"]',
+    
+    # URL patterns
+    'a[href*="page="]',
+    'a[href*="pageNumber="]',
+    'a[href*="pageNum="]',
+    
+    # ARIA patterns
+    '[role="button"][aria-label*="next"]',
+    '[role="button"][aria-label*="Next"]',
+    '[aria-controls*="pagination"]'
+]
+
+# Accessible-name match replacing the old jQuery-only a:contains("Next")/
+# ("Show More") entries, which Chromium's querySelector cannot parse
+NEXT_TEXT_PATTERN = re.compile(r'next|show more', re.I)
+
+# The selector tables are static, so invalid entries are filtered once at
+# import rather than letting querySelector throw at runtime: on V8 a thrown
+# exception costs orders of magnitude more than a null check
+_INVALID_SELECTOR_RE = re.compile(r':contains\(|[{}]')
+
+
+def _validate_selectors(selectors):
+    """Drop selectors Chromium's querySelector would reject"""
+    return [s for s in selectors if not _INVALID_SELECTOR_RE.search(s)]
+
+
+def _partition_link_selectors(selectors):
+    """Split a[href*="..."] selectors into one regex union plus the rest
+
+    Chromium evaluates each substring-attribute selector as a separate
+    walk over every anchor, so ~40 of them in one union is quadratic-ish
+    work. The substrings collapse into a single alternation tested
+    against a.href by the regex engine; class/id/data-attribute link
+    selectors stay as a much smaller joined CSS union.
+    """
+    href_sub_re = re.compile(r'^a\[href[*^]="([^"]+)"\]$')
+    substrings, others = [], []
+    for selector in selectors:
+        match = href_sub_re.match(selector)
+        if match:
+            substrings.append(re.escape(match.group(1)))
+        else:
+            others.append(selector)
+    return '|'.join(substrings), ','.join(others)
 
 class BaseExtractor(ABC):
+    # Convention: one Chromium process for the whole run, pages opened on
+    # the scraper's shared context via scraper.get_page() or
+    # `async with scraper.page()` — never browser.new_page() (that lands
+    # in the default context, outside the shared routing/header setup and
+    # cleanup) and never a private new_context() per extract call
+    #
+    # How long cached results stay valid; extractors can override
+    cache_ttl_hours = 6
+
+    # The shared context aborts image/font/media requests; subclasses
+    # whose extraction depends on fully rendered layout can set this to
+    # False to let their pages load everything
+    block_resources = True
+
+    # Common selectors found across job sites. The table is identical for
+    # every instance, so it lives at class scope with its derived joined
+    # forms; subclasses override by redefining the class attributes
+    selectors = {
+        'containers': [
+            '.job-tile', '[data-job-id]', 'div[class*="job"]', 
+            'div[class*="career"]', 'div[class*="position"]', 
+            '.careers-list', '.job-card', '[class*="job-item"]',
+            'article', '.listing', '.posting',
+            '.bx--card-group__card', '.bx--tile.bx--card',
+            '.bx--card__wrapper', '.bx--card__content',
+            'a[ph-tevent="job_click"]',
+            'a[data-ph-at-id="job-link"]',
+            '.table--advanced-search__row',  # Added for Apple
+            'tr[class*="table--advanced-search"]'  # Added for Apple
+        ],
+        'title_selectors': [
+            '.job-title', '[class*="job-title"]', '[class*="role-title"]',
+            'h1', 'h2', 'h3', 'h4', '[class*="title"]',
+            '.bx--card__heading', '.bx--card__title',
+            'div.job-title span',
+            '[data-ph-at-job-title-text]',
+            '.table--advanced-search__title',  # Added for Apple
+            'a[id^="jotTitle_"]'  # Added for Apple
+        ],
+        'location_selectors': [
+            '.location-text', '[class*="location"]', '.job-location',
+            '[data-location]', '[class*="city"]', '[class*="region"]',
+            '.ibm--card__copy__inner', '.bx--card__copy',
+            '[data-ph-at-job-location-text]',
+            '.table--advanced-search__location'  # Added for Apple
+        ],
+        'link_selectors': [
+            # Job-specific paths
+            'a[href*="/jobs/"]',
+            'a[href*="/careers/"]',
+            'a[href*="/positions/"]',
+            'a[href*="/opportunities/"]',
+            'a[href*="/openings/"]',
+            'a[href*="/vacancy/"]',
+            'a[href*="/role/"]',
+            'a[href*="/details/"]',
+            'a[href*="/description/"]',
+            'a[href*="/apply/"]',
+            
+            # Common URL patterns
+            'a[href*="job"]',
+            'a[href*="career"]',
+            'a[href*="position"]',
+            'a[href*="posting"]',
+            'a[href*="vacancy"]',
+            'a[href*="opening"]',
+            'a[href*="requisition"]',
+            'a[href*="req-id"]',
+            'a[href*="jobid"]',
+            
+            # Common job board patterns
+            'a[href*="linkedin.com/jobs"]',
+            'a[href*="workday.com/"]',
+            'a[href*="lever.co/"]',
+            'a[href*="greenhouse.io/"]',
+            'a[href*="smartrecruiters.com"]',
+            'a[href*="recruitingsite.com"]',
+            'a[href*="brassring.com"]',
+            'a[href*="icims.com"]',
+            
+            # Common URL parameters
+            'a[href*="?job="]',
+            'a[href*="?posting="]',
+            'a[href*="?position="]',
+            'a[href*="?req="]',
+            'a[href*="?id="]',
+            
+            
+            # Common class and ID patterns
+            'a[class*="job-link"]',
+            'a[class*="career-link"]',
+            'a[class*="position-link"]',
+            'a[class*="posting-link"]',
+            'a[id*="job-link"]',
+            'a[data-job-id]',
+            'a[data-posting-id]',
+            
+            # Generic but relevant patterns
+            'a[href*="employment"]',
+            'a[href*="work-with-us"]',
+            'a[href*="join-our-team"]',
+            'a[href*="job-search"]',
+            'a[href*="career-search"]',
+            'a[href*="careers.ibm.com/job"]',
+            'a[ph-tevent="job_click"]',
+            'a[href*="pgcareers.com/"]',
+            'a[href^="/en-in/details/"]',  # Added for Apple
+            'a[id^="jotTitle_"]'  # Added for Apple
+        ],
+        'next_page_selectors': [
+            '.next-page', '.pagination-next', '[class*="next"]',
+            'a[rel="next"]', '.next a', '.load-more-jobs',
+            'ppc-content[key*="nextPaginationText"]',
+            '[data-ph-at-id="pagination-next-text"]',
+            '.pagination li:not(.active) a[href*="startrow="]',
+            'a[href*="startrow="][rel="nofollow"]',
+            '.paginationItemLast',
+            'ul.pagination li:not(.active) a',
+            'ul.pagination li:not(.active):nth-child(2) a',
+            'ul.pagination li a[href*="startrow=10"]',
+            '.pagination li:not(.active) a[title="Page 2"]',
+            '.pagination-well .pagination li:not(.active) a[rel="nofollow"]',
+            '.pager__item:not(.is-active) a[href*="page="]',
+            'li.pager__item a[href*="page="]',
+            'a[href*="page=%2C"][rel="next"]',
+            'a[title="Go to next page"]',
+            'a[href*="page=%2C"][title="Go to next page"]'
+        ]
+    }
+
+    # Joined per-category selector strings for single-shot waits/queries,
+    # plus their JSON forms for interpolation into page.evaluate sources;
+    # all validated and computed once at class-definition time
+    _valid_containers = _validate_selectors(selectors['containers'])
+    _valid_titles = _validate_selectors(selectors['title_selectors'])
+    _valid_locations = _validate_selectors(selectors['location_selectors'])
+    _valid_links = _validate_selectors(selectors['link_selectors'])
+    joined_containers = ','.join(_valid_containers)
+    _titles_css = ','.join(_valid_titles)
+    _locations_css = ','.join(_valid_locations)
+    _links_css = ','.join(_valid_links)
+    _next_list = _validate_selectors(NEXT_PAGE_SELECTORS)
+    _next_joined = ','.join(_next_list)
+    _link_pattern, _link_others_css = _partition_link_selectors(_valid_links)
+    _SELECTOR_JSON = {
+        'containers': _json_dumps(joined_containers),
+        'titles': _json_dumps(_titles_css),
+        'locations': _json_dumps(_locations_css),
+        'links': _json_dumps(_links_css),
+        # Per-category lists for the first-container probe that learns
+        # which single selector wins on the current site
+        'title_list': _json_dumps(_valid_titles),
+        'location_list': _json_dumps(_valid_locations),
+        'link_list': _json_dumps(_valid_links),
+        'link_pattern': _json_dumps(_link_pattern),
+        'link_others': _json_dumps(_link_others_css),
+    }
+
     def __init__(self, scraper):
         self.scraper = scraper
-        # Common selectors found across job sites
-        self.selectors = {
-            'containers': [
-                '.job-tile', '[data-job-id]', 'div[class*="job"]', 
-                'div[class*="career"]', 'div[class*="position"]', 
-                '.careers-list', '.job-card', '[class*="job-item"]',
-                'article', '.listing', '.posting',
-                '.bx--card-group__card', '.bx--tile.bx--card',
-                '.bx--card__wrapper', '.bx--card__content',
-                'a[ph-tevent="job_click"]',
-                'a[data-ph-at-id="job-link"]',
-                '.table--advanced-search__row',  # Added for Apple
-                'tr[class*="table--advanced-search"]'  # Added for Apple
-            ],
-            'title_selectors': [
-                '.job-title', '[class*="job-title"]', '[class*="role-title"]',
-                'h1', 'h2', 'h3', 'h4', '[class*="title"]',
-                '.bx--card__heading', '.bx--card__title',
-                'div.job-title span',
-                '[data-ph-at-job-title-text]',
-                '.table--advanced-search__title',  # Added for Apple
-                'a[id^="jotTitle_"]'  # Added for Apple
-            ],
-            'location_selectors': [
-                '.location-text', '[class*="location"]', '.job-location',
-                '[data-location]', '[class*="city"]', '[class*="region"]',
-                '.ibm--card__copy__inner', '.bx--card__copy',
-                '[data-ph-at-job-location-text]',
-                '.table--advanced-search__location'  # Added for Apple
-            ],
-            'link_selectors': [
-                # Job-specific paths
-                'a[href*="/jobs/"]',
-                'a[href*="/careers/"]',
-                'a[href*="/positions/"]',
-                'a[href*="/opportunities/"]',
-                'a[href*="/openings/"]',
-                'a[href*="/vacancy/"]',
-                'a[href*="/role/"]',
-                'a[href*="/details/"]',
-                'a[href*="/description/"]',
-                'a[href*="/apply/"]',
-                
-                # Common URL patterns
-                'a[href*="job"]',
-                'a[href*="career"]',
-                'a[href*="position"]',
-                'a[href*="posting"]',
-                'a[href*="vacancy"]',
-                'a[href*="opening"]',
-                'a[href*="requisition"]',
-                'a[href*="req-id"]',
-                'a[href*="jobid"]',
-                
-                # Common job board patterns
-                'a[href*="linkedin.com/jobs"]',
-                'a[href*="workday.com/"]',
-                'a[href*="lever.co/"]',
-                'a[href*="greenhouse.io/"]',
-                'a[href*="smartrecruiters.com"]',
-                'a[href*="recruitingsite.com"]',
-                'a[href*="brassring.com"]',
-                'a[href*="icims.com"]',
-                
-                # Common URL parameters
-                'a[href*="?job="]',
-                'a[href*="?posting="]',
-                'a[href*="?position="]',
-                'a[href*="?req="]',
-                'a[href*="?id="]',
-                
-                
-                # Common class and ID patterns
-                'a[class*="job-link"]',
-                'a[class*="career-link"]',
-                'a[class*="position-link"]',
-                'a[class*="posting-link"]',
-                'a[id*="job-link"]',
-                'a[data-job-id]',
-                'a[data-posting-id]',
-                
-                # Generic but relevant patterns
-                'a[href*="employment"]',
-                'a[href*="work-with-us"]',
-                'a[href*="join-our-team"]',
-                'a[href*="job-search"]',
-                'a[href*="career-search"]',
-                'a[href*="careers.ibm.com/job"]',
-                'a[ph-tevent="job_click"]',
-                'a[href*="pgcareers.com/"]',
-                'a[href^="/en-in/details/"]',  # Added for Apple
-                'a[id^="jotTitle_"]'  # Added for Apple
-            ],
-            'next_page_selectors': [
-                '.next-page', '.pagination-next', '[class*="next"]',
-                'a[rel="next"]', '.next a', '.load-more-jobs',
-                'ppc-content[key*="nextPaginationText"]',
-                '[data-ph-at-id="pagination-next-text"]',
-                '.pagination li:not(.active) a[href*="startrow="]',
-                'a[href*="startrow="][rel="nofollow"]',
-                '.paginationItemLast',
-                'ul.pagination li:not(.active) a',
-                'ul.pagination li:not(.active):nth-child(2) a',
-                'ul.pagination li a[href*="startrow=10"]',
-                '.pagination li:not(.active) a[title="Page 2"]',
-                '.pagination-well .pagination li:not(.active) a[rel="nofollow"]',
-                '.pager__item:not(.is-active) a[href*="page="]',
-                'li.pager__item a[href*="page="]',
-                'a[href*="page=%2C"][rel="next"]',
-                'a[title="Go to next page"]',
-                'a[href*="page=%2C"][title="Go to next page"]'
-            ]
-        }
+        self._error_count = 0
+        # Winning title/location/link selectors per host, learned from the
+        # first container on the first page and reused on later pages
+        self._learned_selectors = {}
+        # Winning next-page selector per host: page N+1 almost always
+        # uses the same control as page N, so it is tried first
+        self._next_selector_cache = {}
+
+    async def extract_iter(self, base_url: str,
+                           max_pages: int = 2) -> AsyncIterator[Dict]:
+        """Yield jobs one at a time for streaming consumers
+
+        Default adapter over extract(); subclasses whose scrape is
+        naturally incremental override this with a true generator so
+        downstream writers see jobs before the last page finishes.
+        """
+        for job in await self.extract(base_url, max_pages=max_pages):
+            yield job
 
     async def extract(self, base_url: str, max_pages: int = 2) -> List[Dict]:
+        # Recent result on disk beats a fresh Playwright round-trip
+        cached = scrape_cache.get(base_url, self.cache_ttl_hours)
+        if cached is not None:
+            print(f"Using cached jobs for {base_url}")
+            return cached
+
+        # Fast path: server-rendered listings don't need Chromium at all.
+        # A plain GET plus a static parse is an order of magnitude cheaper;
+        # an empty result means the page needs JS, so fall through to the
+        # browser below
+        static_jobs = await self._extract_static(base_url)
+        if static_jobs:
+            print(f"\nTotal jobs found (static): {len(static_jobs)}")
+            scrape_cache.put(base_url, static_jobs)
+            return static_jobs
+
         jobs = []
+        seen = set()
         try:
-            page = await self.scraper.browser.new_page()
+            # Shared context already applies UA/headers/resource blocking;
+            # get_page keeps the recycle bookkeeping accurate
+            page = await self.scraper.get_page()
+            if not self.block_resources:
+                # Page routes win over context routes, so a pass-through
+                # route re-enables heavy resources for this page only
+                await page.route('**/*', lambda route: route.continue_())
             await page.goto(base_url)
             print("\nWaiting for additional content to load...")
             
@@ -134,353 +343,563 @@ class BaseExtractor(ABC):
             await page.wait_for_load_state('networkidle')
             await asyncio.sleep(2)  # Give extra time for dynamic content
             
-            # Try multiple selectors for job containers
-            for container_selector in self.selectors['containers']:
-                try:
-                    # Wait for any container to appear
-                    await page.wait_for_selector(container_selector, timeout=5000)
-                    containers = await page.query_selector_all(container_selector)
-                    if containers:
-                        print(f"Found containers using selector: {container_selector}")
-                        break
-                except:
+            # One evaluate finds the first container selector with matches;
+            # the old per-selector loop burned up to 5s of wait_for_selector
+            # timeout per miss before any data came back
+            winner = await page.evaluate("""
+                (sels) => {
+                    for (const s of sels) {
+                        if (document.querySelectorAll(s).length) return s;
+                    }
+                    return null;
+                }
+            """, self._valid_containers)
+            if winner:
+                print(f"Found containers using selector: {winner}")
+
+            print("\nProcessing page 1")
+            page_jobs = await self._evaluate_page_jobs(page)
+
+            # Add new jobs, deduping on URL via set lookup instead of
+            # scanning the whole list per job
+            for job in page_jobs:
+                key = (job.get('url', ''), job.get('title', ''))
+                if key in seen:
                     continue
-            
-            current_page = 1
-            while current_page <= max_pages:
-                print(f"\nProcessing page {current_page}")
-                print("Waiting for page load...")
-                
-                # Wait for job listings to appear
-                await page.wait_for_load_state('networkidle')
-                await asyncio.sleep(2)  # Additional wait for dynamic content
-                
-                # Extract jobs using JavaScript for better reliability
-                page_jobs = await page.evaluate("""
-                    () => {
-                        const jobs = [];
-                        // Try all provided selectors
-                        const containerSelectors = %s;
-                        const titleSelectors = %s;
-                        const locationSelectors = %s;
-                        const linkSelectors = %s;
-                        
-                        // Find all job containers
-                        let containers = [];
-                        for (const selector of containerSelectors) {
-                            const elements = document.querySelectorAll(selector);
-                            if (elements.length > 0) {
-                                containers = elements;
-                                break;
+                seen.add(key)
+                jobs.append(job)
+                print(f"Found job: {job['title']} - {job['location']}")
+
+            if max_pages > 1:
+                # Pages 2..N: prefer concurrent workers over discovered
+                # pagination URLs; fall back to serial Next clicks when the
+                # pagination is script-driven
+                page_urls = await self.discover_page_urls(page, max_pages)
+                if page_urls:
+                    semaphore = asyncio.Semaphore(4)  # Avoid triggering anti-bot
+                    results = await asyncio.gather(
+                        *[self._scrape_page_url(url, semaphore) for url in page_urls],
+                        return_exceptions=True
+                    )
+                    for result in results:
+                        if isinstance(result, Exception):
+                            print(f"Error scraping worker page: {result}")
+                            continue
+                        for job in result:
+                            key = (job.get('url', ''), job.get('title', ''))
+                            if key in seen:
+                                continue
+                            seen.add(key)
+                            jobs.append(job)
+                            print(f"Found job: {job['title']} - {job['location']}")
+                else:
+                    current_page = 2
+                    while current_page <= max_pages:
+                        next_page_found = await self.try_next_page(page)
+                        if not next_page_found:
+                            break
+
+                        print(f"\nProcessing page {current_page}")
+                        # Wait for job listings to appear instead of
+                        # networkidle, which never resolves on sites with
+                        # background polling
+                        try:
+                            await page.wait_for_selector(self.joined_containers,
+                                                         state='attached', timeout=15000)
+                        except Exception:
+                            pass  # Proceed with whatever has rendered so far
+
+                        page_jobs = await self._evaluate_page_jobs(page)
+                        for job in page_jobs:
+                            key = (job.get('url', ''), job.get('title', ''))
+                            if key in seen:
+                                continue
+                            seen.add(key)
+                            jobs.append(job)
+                            print(f"Found job: {job['title']} - {job['location']}")
+
+                        current_page += 1
+                        # try_next_page already waited for the listing to
+                        # change; just yield to the event loop
+                        await asyncio.sleep(0)
+
+            await page.close()
+            print(f"\nTotal jobs found: {len(jobs)}")
+            if jobs:
+                scrape_cache.put(base_url, jobs)
+            return jobs
+
+        except Exception as e:
+            print(f"Error extracting jobs: {str(e)}")
+            if 'page' in locals():
+                # Screenshots are opt-in and capped: encoding a full-page
+                # PNG per transient failure slows batch crawls and litters
+                # the working directory
+                if os.environ.get('SCRAPER_DEBUG_SCREENSHOTS') and self._error_count < 3:
+                    try:
+                        await page.screenshot(
+                            path=f'error_screenshot_{datetime.now().strftime("%Y%m%d_%H%M%S")}.jpg',
+                            type='jpeg', quality=60)
+                        self._error_count += 1
+                        print("Error screenshot saved")
+                    except:
+                        pass
+                await page.close()
+            return []
+
+    async def _extract_static(self, url: str) -> List[Dict]:
+        """Attempt extraction from the raw HTML without a browser
+
+        Uses the same container/title/location/link selector table as the
+        in-page JS, but against an lxml-backed BeautifulSoup parse of the
+        plain GET response. Returns [] on any failure or when no usable
+        containers are found, which tells extract() to fall back to
+        Playwright.
+        """
+        try:
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            }
+            timeout = aiohttp.ClientTimeout(total=15)
+            async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
+                async with session.get(url) as response:
+                    if response.status != 200:
+                        return []
+                    html = await response.text()
+        except Exception as e:
+            print(f"Static fetch failed ({e}); using browser")
+            return []
+
+        try:
+            soup = BeautifulSoup(html, 'lxml')
+            containers = soup.select(self.joined_containers)
+        except Exception:
+            return []
+
+        jobs = []
+        seen = set()
+        for container in containers:
+            try:
+                title_el = container.select_one(self._titles_css)
+                title = title_el.get_text(strip=True) if title_el else ''
+
+                link = container.select_one(self._links_css)
+                if link is None and container.name == 'a':
+                    link = container
+                href = link.get('href') if link is not None else ''
+                job_url = urljoin(url, href) if href else ''
+
+                location_el = container.select_one(self._locations_css)
+                location = location_el.get_text(strip=True) if location_el else ''
+
+                if not title or not (job_url or location):
+                    continue
+
+                id_match = re.search(r'\d+', job_url)
+                job_id = id_match.group(0) if id_match else ''
+
+                key = (job_url, title)
+                if key in seen:
+                    continue
+                seen.add(key)
+                jobs.append({
+                    'title': title,
+                    'location': location,
+                    'url': job_url,
+                    'job_id': job_id
+                })
+            except Exception:
+                continue
+        return jobs
+
+    async def discover_page_urls(self, page, max_pages: int) -> List[str]:
+        """Collect URLs for pages 2..max_pages from pagination links
+
+        One evaluate returns every candidate href; deduping and filtering
+        happen in Python where set lookups are cheap, keeping only URLs on
+        the current listing's path so unrelated paginated widgets are
+        ignored.
+        """
+        try:
+            hrefs = await page.evaluate("""
+                () => Array.from(
+                    document.querySelectorAll(
+                        'a[href*="page="], a[href*="startrow="], a[href*="pageNumber="], a[href*="start="]'),
+                    a => a.href)
+            """)
+        except Exception:
+            return []
+
+        current_path = urlparse(page.url).path
+        urls = []
+        seen = set()
+        for href in hrefs:
+            if not href or href == page.url or href in seen:
+                continue
+            if urlparse(href).path != current_path:
+                continue
+            seen.add(href)
+            urls.append(href)
+            if len(urls) >= max_pages - 1:
+                break
+        return urls
+
+    @staticmethod
+    def synthesize_page_urls(next_href: str, max_pages: int) -> List[str]:
+        """Derive URLs for pages 3..max_pages from the page-2 href
+
+        The next link encodes its page position in the query string, so
+        substituting incremented values yields the remaining page URLs
+        up front and lets them be fetched concurrently instead of
+        navigating serially to discover each one. startrow-style offsets
+        (value larger than the page count) step by their own size.
+        """
+        urls = [next_href]
+        # Whole-name alternation: a substring match on "p"/"page" would
+        # also capture params like dept= or pageSize= and increment those
+        match = re.search(
+            r'([?&](?:page|pagenumber|pagenum|pg|start|startrow|offset|p)=)(\d+)',
+            next_href, re.I)
+        if not match:
+            return urls
+        value = int(match.group(2))
+        step = value if value > max_pages else 1
+        for n in range(1, max_pages - 1):
+            urls.append(next_href[:match.start(2)]
+                        + str(value + n * step)
+                        + next_href[match.end(2):])
+        return urls[:max_pages - 1]
+
+    async def _scrape_page_url(self, url: str, semaphore) -> List[Dict]:
+        """Scrape one pre-discovered pagination URL in its own tab"""
+        async with semaphore:
+            # Worker tabs share the pooled context instead of paying an
+            # implicit context creation per browser.new_page call
+            page = await self.scraper.get_page()
+            try:
+                if not self.block_resources:
+                    await page.route('**/*', lambda route: route.continue_())
+                await page.goto(url, wait_until='domcontentloaded')
+                try:
+                    await page.wait_for_selector(self.joined_containers,
+                                                 state='attached', timeout=15000)
+                except Exception:
+                    pass
+                return await self._evaluate_page_jobs(page)
+            finally:
+                await page.close()
+
+    async def _evaluate_page_jobs(self, page) -> List[Dict]:
+        """Run the in-page extraction JS against the current page
+
+        The first container on a new host is probed to learn which single
+        title/location/link selector wins there; all remaining containers
+        (and all later pages for that host) use the narrow winner instead
+        of the full joined union, then the winners are cached per host.
+        """
+        host = urlparse(page.url).netloc
+        learned = self._learned_selectors.get(host)
+        result = await page.evaluate("""
+                    (learned) => {
+                        // Parallel arrays instead of per-job objects: no
+                        // repeated key names over the CDP socket and a
+                        // cheaper JSON parse on the Python side
+                        const titles = [];
+                        const urls = [];
+                        const locations = [];
+                        const jobIds = [];
+                        const containersCss = %s;
+                        const titleCss = %s;
+                        const locationCss = %s;
+                        const titleList = %s;
+                        const locationList = %s;
+                        const linkList = %s;
+                        // One alternation over all href substrings: a
+                        // single anchor walk per container instead of ~40
+                        // substring-attribute selector passes
+                        const LINK_RE = new RegExp(%s, 'i');
+                        const linkOthersCss = %s;
+                        const ID_RE = /\\d+/;  // compiled once, not per container
+                        const findLink = (container) => {
+                            let link = linkOthersCss ? container.querySelector(linkOthersCss) : null;
+                            if (link?.href) return link;
+                            const anchors = container.querySelectorAll('a[href]');
+                            for (let j = 0, m = anchors.length; j < m; j++) {
+                                if (LINK_RE.test(anchors[j].href)) return anchors[j];
                             }
+                            return null;
+                        };
+
+                        // Find all job containers with a single query
+                        let containers = [];
+                        try {
+                            containers = document.querySelectorAll(containersCss);
+                        } catch (e) {
+                            console.error('Error querying containers:', e);
+                            return { titles, urls, locations, jobIds, winners: null };
                         }
-                        
-                        containers.forEach(container => {
-                            try {
-                                // Find title
-                                let title = '';
-                                for (const selector of titleSelectors) {
-                                    const element = container.querySelector(selector);
-                                    if (element) {
-                                        title = element.textContent.trim();
-                                        break;
-                                    }
-                                }
-                                
-                                // Find location
-                                let location = '';
-                                for (const selector of locationSelectors) {
-                                    const element = container.querySelector(selector);
-                                    if (element) {
-                                        location = element.textContent.trim();
-                                        break;
-                                    }
+
+                        // Learn the winning selector per category from the
+                        // first container, unless the caller already knows
+                        let tSel = learned?.title || null;
+                        let lSel = learned?.location || null;
+                        let uSel = learned?.link || null;
+                        if (containers.length && !(tSel && lSel && uSel)) {
+                            const first = containers[0];
+                            // Selectors are validated at import, so the
+                            // probe can call querySelector directly
+                            const probe = (sels) => {
+                                for (const s of sels) {
+                                    if (first.querySelector(s)) return s;
                                 }
-                                
-                                // Find link
+                                return null;
+                            };
+                            tSel = tSel || probe(titleList);
+                            lSel = lSel || probe(locationList);
+                            uSel = uSel || probe(linkList);
+                        }
+                        // Fall back to the joined union (or the regex
+                        // anchor walk for links) when the probe missed
+                        const titleSel = tSel || titleCss;
+                        const locationSel = lSel || locationCss;
+
+                        for (let i = 0, n = containers.length; i < n; i++) {
+                            const container = containers[i];
+                            try {
+                                const title =
+                                    container.querySelector(titleSel)?.textContent.trim() || '';
+                                const location =
+                                    container.querySelector(locationSel)?.textContent.trim() || '';
+
                                 let url = '';
                                 let job_id = '';
-                                for (const selector of linkSelectors) {
-                                    const element = container.querySelector(selector);
-                                    if (element && element.href) {
-                                        url = element.href;
-                                        // Extract job ID from URL or element ID
-                                        const urlMatch = url.match(/\\d+/);
-                                        if (urlMatch) {
-                                            job_id = urlMatch[0];
-                                        }
-                                        break;
+                                let link = uSel ? container.querySelector(uSel) : null;
+                                if (!link?.href) {
+                                    link = findLink(container);
+                                }
+                                if (link && link.href) {
+                                    url = link.href;
+                                    // Extract job ID from URL or element ID
+                                    const urlMatch = url.match(ID_RE);
+                                    if (urlMatch) {
+                                        job_id = urlMatch[0];
                                     }
                                 }
-                                
+
                                 if (title && (url || location)) {
-                                    jobs.push({ title, location, url, job_id });
+                                    titles.push(title);
+                                    urls.push(url);
+                                    locations.push(location);
+                                    jobIds.push(job_id);
                                 }
                             } catch (e) {
                                 console.error('Error processing container:', e);
                             }
-                        });
-                        return jobs;
+                        }
+                        return { titles, urls, locations, jobIds,
+                                 winners: { title: tSel, location: lSel, link: uSel } };
                     }
-                """ % (json.dumps(self.selectors['containers']), 
-                      json.dumps(self.selectors['title_selectors']),
-                      json.dumps(self.selectors['location_selectors']),
-                      json.dumps(self.selectors['link_selectors'])))
-                
-                # Add new jobs
-                for job in page_jobs:
-                    if job not in jobs:  # Avoid duplicates
-                        jobs.append(job)
-                        print(f"Found job: {job['title']} - {job['location']}")
-                
-                if current_page >= max_pages:
-                    break
-                
-                # Try to find and click next page button
-                next_page_found = await self.try_next_page(page)
-                if not next_page_found:
-                    break
-                    
-                current_page += 1
-                # Increased delay between pages
-                await asyncio.sleep(5)
-            
-            await page.close()
-            print(f"\nTotal jobs found: {len(jobs)}")
-            return jobs
-            
-        except Exception as e:
-            print(f"Error extracting jobs: {str(e)}")
-            if 'page' in locals():
-                try:
-                    # Take screenshot on error for debugging
-                    await page.screenshot(path=f'error_screenshot_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png')
-                    print("Error screenshot saved")
-                except:
-                    pass
-                await page.close()
-            return []
+                """ % (self._SELECTOR_JSON['containers'],
+                      self._SELECTOR_JSON['titles'],
+                      self._SELECTOR_JSON['locations'],
+                      self._SELECTOR_JSON['title_list'],
+                      self._SELECTOR_JSON['location_list'],
+                      self._SELECTOR_JSON['link_list'],
+                      self._SELECTOR_JSON['link_pattern'],
+                      self._SELECTOR_JSON['link_others']), learned)
+
+        winners = result.get('winners') or {}
+        if host not in self._learned_selectors and winners.get('title'):
+            self._learned_selectors[host] = winners
+        # Zip the columnar payload back into the dict-per-job shape the
+        # rest of the pipeline expects
+        return [
+            {'title': title, 'location': location, 'url': url, 'job_id': job_id}
+            for title, url, location, job_id in zip(
+                result['titles'], result['urls'],
+                result['locations'], result['jobIds'])
+        ]
 
     async def extract_job_links(self, page):
         """Enhanced job extraction with intelligent selectors"""
         try:
-            # Add delay to ensure page is fully loaded
-            await asyncio.sleep(2)
-            
-            # Check if page is loaded properly
-            if not await self.scraper.wait_for_page_load(page):
-                print("Page not loaded properly, retrying...")
-                await page.reload()
-                await asyncio.sleep(5)
-                if not await self.scraper.wait_for_page_load(page):
-                    print("Page still not loaded properly after retry")
-                    return []
-
-            # Convert selectors lists to JavaScript arrays
-            containers_js = json.dumps(self.selectors['containers'])
-            titles_js = json.dumps(self.selectors['title_selectors'])
-            locations_js = json.dumps(self.selectors['location_selectors'])
-            links_js = json.dumps(self.selectors['link_selectors'])
-
-            jobs = await page.evaluate(f"""
+            # One combined selector per category instead of JS-side loops;
+            # JSON forms were computed at class-definition time
+            containers_js = self._SELECTOR_JSON['containers']
+            titles_js = self._SELECTOR_JSON['titles']
+            locations_js = self._SELECTOR_JSON['locations']
+            link_pattern_js = self._SELECTOR_JSON['link_pattern']
+            link_others_js = self._SELECTOR_JSON['link_others']
+
+            extract_js = f"""
                 () => {{
-                    const jobs = new Set();
-                    const containers = {containers_js};
-                    const titleSelectors = {titles_js};
-                    const locationSelectors = {locations_js};
-                    const linkSelectors = {links_js};
-                    
-                    const safeQuerySelector = (element, selectors) => {{
-                        for (const selector of selectors) {{
-                            try {{
-                                const found = element.querySelector(selector);
-                                if (found) return found;
-                            }} catch {{
-                                continue;
-                            }}
+                    // Map keyed on href dedupes by reference — no
+                    // stringify/parse round-trip per job
+                    const jobs = new Map();
+                    const containersCss = {containers_js};
+                    const titleCss = {titles_js};
+                    const locationCss = {locations_js};
+                    const LINK_RE = new RegExp({link_pattern_js}, 'i');
+                    const linkOthersCss = {link_others_js};
+                    const findLink = (container) => {{
+                        let link = linkOthersCss ? container.querySelector(linkOthersCss) : null;
+                        if (link?.href) return link;
+                        const anchors = container.querySelectorAll('a[href]');
+                        for (let j = 0, m = anchors.length; j < m; j++) {{
+                            if (LINK_RE.test(anchors[j].href)) return anchors[j];
                         }}
                         return null;
                     }};
-                    
-                    const findJobElements = () => {{
-                        let elements = [];
-                        for (const selector of containers) {{
-                            try {{
-                                elements = [...elements, ...document.querySelectorAll(selector)];
-                            }} catch {{
-                                continue;
-                            }}
-                        }}
-                        return elements;
-                    }};
-                    
-                    const jobElements = findJobElements();
-                    
-                    jobElements.forEach(container => {{
+
+                    let jobElements = [];
+                    try {{
+                        jobElements = document.querySelectorAll(containersCss);
+                    }} catch (e) {{
+                        console.error('Error querying containers:', e);
+                    }}
+
+                    for (let i = 0, n = jobElements.length; i < n; i++) {{
+                        const container = jobElements[i];
                         try {{
-                            let link = null;
-                            // Try finding link in container first
-                            for (const linkSelector of linkSelectors) {{
-                                link = safeQuerySelector(container, [linkSelector]);
-                                if (link?.href) break;
-                            }}
-                            
+                            // Regex anchor walk instead of a ~40-selector union
+                            let link = findLink(container);
+
                             // If no link found, check if container itself is a link
                             if (!link?.href && container.tagName === 'A') {{
                                 link = container;
                             }}
-                                
+
                             if (link?.href) {{
-                                const title = 
-                                    safeQuerySelector(container, titleSelectors)?.textContent ||
+                                const title =
+                                    container.querySelector(titleCss)?.textContent ||
                                     link.textContent;
-                                    
-                                const location = 
-                                    safeQuerySelector(container, locationSelectors)?.textContent ||
+
+                                const location =
+                                    container.querySelector(locationCss)?.textContent ||
                                     '';
-                                
-                                if (title?.trim()) {{
-                                    jobs.add(JSON.stringify({{
+
+                                if (title?.trim() && !jobs.has(link.href)) {{
+                                    jobs.set(link.href, {{
                                         url: link.href,
                                         title: title.trim(),
                                         location: location?.trim() || ''
-                                    }}));
+                                    }});
                                 }}
                             }}
                         }} catch (e) {{
                             console.error('Error processing container:', e);
                         }}
-                    }});
-                    
-                    return Array.from(jobs).map(job => JSON.parse(job));
+                    }}
+
+                    // Readiness rides along with the extraction so Python
+                    // needs no separate liveness probe round-trip
+                    const ready = jobElements.length > 0 || document.readyState === 'complete';
+                    return {{ ready, jobs: Array.from(jobs.values()) }};
                 }}
-            """)
-            
-            return jobs
-            
+            """
+
+            # The evaluate doubles as the readiness probe: retry with
+            # exponential backoff only while the page reports not-ready
+            # and extraction came back empty
+            delay = 1
+            for attempt in range(3):
+                result = await page.evaluate(extract_js)
+                if result['ready'] or result['jobs']:
+                    return result['jobs']
+                print(f"Page not ready, retrying in {delay}s...")
+                await asyncio.sleep(delay)
+                delay *= 2
+            return result['jobs']
+
         except Exception as e:
             print(f"Error in job extraction: {str(e)}")
             return []
 
     async def try_next_page(self, page) -> bool:
-        """Try different methods to find and click next page button"""
-        next_page_selectors = [
-            # Standard next buttons
-            '[aria-label*="Next"]',
-            '[aria-label*="next"]',
-            '[class*="next"]',
-            '[class*="Next"]',
-            'a[rel="next"]',
-            '.next-page',
-            '.nextPage',
-            '.pagination__next',
-            
-            # Button-specific selectors
-            'button[aria-label*="next"]',
-            'button[aria-label*="Next"]',
-            'button[class*="next"]',
-            'button[class*="Next"]',
-            'button.next',
-            'button.Next',
-            '[data-action*="next"]',
-            '[data-action*="Next"]',
-            
-            # Common pagination patterns
-            '.pagination li:last-child a',
-            '.pagination__next a',
-            '[class*="pagination-next"]',
-            '[class*="pager-next"]',
-            '.next-link',
-            
-            # Icon/Arrow based selectors
-            '[class*="arrow-next"]',
-            '[class*="arrow_next"]',
-            '[class*="chevron-right"]',
-            '[aria-label="Forward"]',
-            '[aria-label="Next Page"]',
-            
-            # Form-based pagination (like Apple)
-            '#frmPagination',
-            'form[id*="pagination"]',
-            'form[class*="pagination"]',
-            
-            # Common text patterns
-            'a:contains("Next")',
-            'a:contains("next")',
-            'a:contains("Next Page")',
-            'a:contains("Show More")',
-            
-            # Data attribute patterns
-            '[data-page="next"]',
-            '[data-navigation="next"]',
-            '[data-test*="next"]',
-            '[data-testid*="next"]',
-            
-            # Common class name patterns
-            '.load-more',
-            '.loadMore',
-            '.show-more',
-            '.showMore',
-            
-            # SVG/Icon containers
-            '[class*="next-icon"]',
-            '[class*="nextIcon"]',
-            '.icon-next',
-            '.iconNext',
-            
-            # Specific vendor patterns
-            '[class*="pagination-next"]',
-            '[class*="pager-next"]',
-            '[class*="paginate-next"]',
-            
-            # URL patterns
-            'a[href*="page="]',
-            'a[href*="pageNumber="]',
-            'a[href*="pageNum="]',
-            
-            # ARIA patterns
-            '[role="button"][aria-label*="next"]',
-            '[role="button"][aria-label*="Next"]',
-            '[aria-controls*="pagination"]'
-        ]
+        """Find and activate the next-page control with a single DOM query"""
+        # Snapshot the first job link so we can wait for the listing to
+        # actually change instead of sleeping
+        old_url = await page.evaluate(
+            "() => document.querySelector('.job-tile a, [data-job-id] a')?.href || ''")
 
-        # Additional form-based pagination selectors
-        pagination_form_selectors = {
-            'form': [
-                '#frmPagination',
-                'form[id*="pagination"]',
-                'form[class*="pagination"]',
-                '.pagination__mid form'
-            ],
-            'input': [
-                '#page-number',
-                'input[name*="page"]',
-                'input[id*="page"]',
-                '[type="text"][name*="page"]'
-            ],
-            'total_pages': [
-                '.pageNumber:last-child',
-                '[class*="total-pages"]',
-                '[class*="page-count"]',
-                'span:contains("of")+span'
-            ]
-        }
-        
-        for selector in next_page_selectors:
+        # One evaluate replaces ~50 sequential query_selector/is_visible
+        # round-trips. The host's previously winning selector is tried
+        # first; the full list is only scanned on a miss, and whichever
+        # selector wins is remembered for the next page
+        host = urlparse(page.url).netloc
+        try:
+            target = await page.evaluate("""
+                (args) => {
+                    const pickVisible = (sel) => {
+                        const els = document.querySelectorAll(sel);
+                        for (const el of els) {
+                            const rect = el.getBoundingClientRect();
+                            if (rect.width > 0 && rect.height > 0) {
+                                return el;
+                            }
+                        }
+                        return null;
+                    };
+                    const activate = (el, sel) => {
+                        if (el.href) {
+                            return { href: el.href, selector: sel };
+                        }
+                        el.click();
+                        return { href: null, selector: sel };
+                    };
+                    if (args.cached) {
+                        const el = pickVisible(args.cached);
+                        if (el) return activate(el, args.cached);
+                    }
+                    for (const sel of args.selectors) {
+                        const el = pickVisible(sel);
+                        if (el) return activate(el, sel);
+                    }
+                    return null;
+                }
+            """, {'cached': self._next_selector_cache.get(host),
+                  'selectors': self._next_list})
+        except Exception:
+            return False
+
+        if target is not None and target.get('selector'):
+            self._next_selector_cache[host] = target['selector']
+
+        if target is None:
+            # Text-labelled controls ('Next', 'Show More') have no stable
+            # class/attribute; match them by accessible name instead of
+            # the unparseable :contains() CSS they used to rely on
             try:
-                next_button = await page.query_selector(selector)
-                if next_button and await next_button.is_visible():
-                    # Check if it's a link or button
-                    if await next_button.get_attribute('href'):
-                        await page.goto(await next_button.get_attribute('href'))
-                    else:
-                        await next_button.click()
-                    await page.wait_for_load_state('networkidle')
-                    return True
-            except:
-                continue
-        
-        return False
+                locator = page.get_by_role('link', name=NEXT_TEXT_PATTERN).first
+                href = await locator.evaluate('el => el.href', timeout=2000)
+                if href:
+                    target = {'href': href}
+            except Exception:
+                pass
+        if target is None:
+            return False
+
+        try:
+            if target['href']:
+                # Wait for the new page's containers rather than
+                # networkidle, which stalls on polling-heavy sites
+                await page.goto(target['href'], wait_until='domcontentloaded')
+                try:
+                    await page.wait_for_selector(self.joined_containers,
+                                                 state='attached', timeout=15000)
+                except Exception:
+                    pass
+            else:
+                try:
+                    await page.wait_for_function(
+                        "(u) => (document.querySelector('.job-tile a, [data-job-id] a')?.href || '') !== u",
+                        arg=old_url, timeout=15000)
+                except Exception:
+                    await page.wait_for_load_state('domcontentloaded')
+            return True
+        except Exception:
+            return False
 
     async def clean_job_description(self, html: str) -> str:
         """Clean job description HTML"""
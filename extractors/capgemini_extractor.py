@@ -1,6 +1,5 @@
-from typing import List, Dict
+from typing import AsyncIterator, List, Dict
 from .base_extractor import BaseExtractor
-import asyncio
 import logging
 
 class CapgeminiExtractor(BaseExtractor):
@@ -11,91 +10,120 @@ class CapgeminiExtractor(BaseExtractor):
     async def extract(self, base_url: str, max_pages: int = 2) -> List[Dict]:
         """
         Extract jobs from Capgemini careers page
-        
+
         Args:
             base_url: Base URL for Capgemini careers page
             max_pages: Number of times to click "Load more"
         """
+        return [job async for job
+                in self.extract_iter(base_url, max_pages=max_pages)]
+
+    async def extract_iter(self, base_url: str,
+                           max_pages: int = 2) -> AsyncIterator[Dict]:
+        """Yield Capgemini jobs batch by batch as Load-More reveals them
+
+        Streaming consumers can pipeline (e.g. write one batch out while
+        the next is still loading) instead of waiting on the full
+        accumulated list.
+        """
+        page = None
         try:
-            # Create new page using browser context
-            context = await self.scraper.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            page = await context.new_page()
-            all_jobs = []
-            
+            # Reuse the shared context (viewport/UA/resource blocking are
+            # preset there) instead of paying context startup per call
+            page = await self.scraper.get_page()
+            seen = set()
+
             # Load initial page
             await page.goto(base_url, wait_until='networkidle')
             await page.wait_for_selector('a.table-tr.filter-box.joblink')
-            
-            # Click "Load more" button max_pages times
+
+            # Click "Load more" button max_pages times. Extraction, the
+            # row-count snapshot and the button click all ride in one
+            # evaluate per iteration; the only other round-trip is the
+            # wait for the new rows to land
             for click_count in range(max_pages):
-                # Extract current page jobs
-                jobs = await self.extract_jobs_from_page(page)
-                all_jobs.extend(jobs)
-                
-                if click_count < max_pages - 1:  # Don't click after last page
-                    # Find and click "Load more" button
-                    load_more = await page.query_selector('a.filters-more[aria-label="Load More about jobs"]')
-                    if not load_more:
+                want_more = click_count < max_pages - 1
+                result = await self.extract_jobs_from_page(
+                    page, click_load_more=want_more)
+
+                # Load-More keeps earlier rows in the DOM, so dedupe on
+                # (url, title) with a set
+                for job in result['jobs']:
+                    key = (job.get('url', ''), job.get('title', ''))
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    yield job
+
+                if want_more:
+                    if not result['had_button']:
                         self.logger.info("No more jobs to load")
                         break
-                        
-                    # Get current job count for verification
-                    current_count = len(all_jobs)
-                    
-                    # Click and wait for new content
-                    await load_more.click()
-                    await page.wait_for_load_state('networkidle')
-                    await asyncio.sleep(2)  # Wait for content to load
-                    
-                    # Verify new content loaded
-                    await page.wait_for_selector('a.table-tr.filter-box.joblink')
-                    
+
+                    # The click already happened in-page; wait for the row
+                    # count to grow past the snapshot instead of
+                    # networkidle + a fixed sleep
+                    await page.wait_for_function(
+                        "(n) => document.querySelectorAll('a.table-tr.filter-box.joblink').length > n",
+                        arg=result['row_count'], timeout=10000)
+
                     self.logger.info(f"Clicked 'Load more' button ({click_count + 1}/{max_pages})")
 
-            await page.close()
-            self.logger.info(f"Total jobs found: {len(all_jobs)}")
-            return all_jobs
+            self.logger.info(f"Total jobs found: {len(seen)}")
 
         except Exception as e:
             self.logger.error(f"Error extracting Capgemini jobs: {str(e)}")
-            if 'page' in locals():
+        finally:
+            if page is not None:
                 await page.close()
-            return []
 
-    async def extract_jobs_from_page(self, page) -> List[Dict]:
-        """Extract jobs from current page content"""
+    async def extract_jobs_from_page(self, page, click_load_more: bool = False) -> Dict:
+        """Extract jobs from current page content
+
+        Returns {'jobs': [...], 'had_button': bool, 'row_count': int}.
+        When click_load_more is set, the Load-More button is clicked
+        inside the same evaluate, so extraction, the row-count snapshot
+        and the click cost one round-trip instead of three.
+        """
         try:
-            jobs = await page.evaluate("""
-                () => {
+            result = await page.evaluate("""
+                (clickLoadMore) => {
                     const jobs = [];
-                    
-                    // Capgemini job selectors
-                    document.querySelectorAll('a.table-tr.filter-box.joblink').forEach(element => {
+
+                    // Constants hoisted out of the per-row loop
+                    const origin = window.location.origin;
+                    const invalidTitles = [
+                        'saved jobs', 'filter results', 'search', 'previous',
+                        'next', 'load more', 'new job search', 'careers'
+                    ];
+
+                    // Capgemini job selectors; one query also supplies the
+                    // row-count snapshot the caller waits against
+                    const rows = document.querySelectorAll('a.table-tr.filter-box.joblink');
+                    rows.forEach(element => {
                         try {
                             const title = element.querySelector('.table-td.table-title div:not(.table-td-header)')?.textContent.trim();
-                            const url = new URL(element.getAttribute('href'), window.location.origin).href;
-                            const locationDiv = Array.from(element.querySelectorAll('.table-td.table-title'))
-                                .find(td => td.querySelector('.table-td-header')?.textContent.includes('Location'));
-                            const location = locationDiv?.querySelector('div:not(.table-td-header)')?.textContent.trim() || '';
-                            
-                            // Additional details
-                            const experienceDiv = Array.from(element.querySelectorAll('.table-td.table-title'))
-                                .find(td => td.querySelector('.table-td-header')?.textContent.includes('Experience'));
-                            const experience = experienceDiv?.querySelector('div:not(.table-td-header)')?.textContent.trim() || '';
-                            
-                            const contractDiv = Array.from(element.querySelectorAll('.table-td.table-title'))
-                                .find(td => td.querySelector('.table-td-header')?.textContent.includes('Contract'));
-                            const contractType = contractDiv?.querySelector('div:not(.table-td-header)')?.textContent.trim() || '';
-                            
-                            // Filter out non-job entries
-                            const invalidTitles = [
-                                'saved jobs', 'filter results', 'search', 'previous', 
-                                'next', 'load more', 'new job search', 'careers'
-                            ];
-                            
+                            const url = new URL(element.getAttribute('href'), origin).href;
+
+                            // One pass over the cells builds a header->value
+                            // map instead of re-scanning the row per field
+                            const byHeader = {};
+                            element.querySelectorAll('.table-td.table-title').forEach(td => {
+                                const h = td.querySelector('.table-td-header')?.textContent;
+                                if (h) {
+                                    byHeader[h.trim()] = td.querySelector('div:not(.table-td-header)')?.textContent.trim() || '';
+                                }
+                            });
+                            const field = (word) => {
+                                for (const key in byHeader) {
+                                    if (key.includes(word)) return byHeader[key];
+                                }
+                                return '';
+                            };
+                            const location = field('Location');
+                            const experience = field('Experience');
+                            const contractType = field('Contract');
+
                             // Validate the entry
                             if (title && 
                                 url.includes('/jobs/') && 
@@ -114,27 +142,40 @@ class CapgeminiExtractor(BaseExtractor):
                             console.error('Error processing job element:', e);
                         }
                     });
-                    
-                    return jobs;
+
+                    // Click Load-More in the same evaluate when asked to
+                    let hadButton = false;
+                    if (clickLoadMore) {
+                        const btn = document.querySelector(
+                            'a.filters-more[aria-label="Load More about jobs"]');
+                        if (btn) {
+                            hadButton = true;
+                            btn.click();
+                        }
+                    }
+
+                    return { jobs, hadButton, rowCount: rows.length };
                 }
-            """)
-            
+            """, click_load_more)
+
             # Additional Python-side filtering
             filtered_jobs = [
-                job for job in jobs
-                if (job.get('title') and 
-                    job.get('url') and 
+                job for job in result['jobs']
+                if (job.get('title') and
+                    job.get('url') and
                     not job['title'].startswith('#') and
                     not job['title'].lower().startswith('filter') and
                     len(job['title'].strip()) > 0)
             ]
-            
+
             self.logger.info(f"Found {len(filtered_jobs)} valid jobs on current page")
-            return filtered_jobs
-            
+            return {'jobs': filtered_jobs,
+                    'had_button': result['hadButton'],
+                    'row_count': result['rowCount']}
+
         except Exception as e:
             self.logger.error(f"Error extracting jobs from page: {str(e)}")
-            return []
+            return {'jobs': [], 'had_button': False, 'row_count': 0}
 
     async def try_next_page(self, page) -> bool:
         """Try to load more jobs"""
@@ -142,9 +183,14 @@ class CapgeminiExtractor(BaseExtractor):
             # Try Capgemini load more button
             load_more = await page.query_selector('a.filters-more[aria-label="Load More about jobs"]')
             if load_more and await load_more.is_visible():
+                prev_count = await page.evaluate(
+                    "() => document.querySelectorAll('a.table-tr.filter-box.joblink').length")
                 await load_more.click()
-                await page.wait_for_load_state('networkidle')
-                await asyncio.sleep(2)
+                # Resolve the instant new rows land rather than waiting
+                # out networkidle plus a blanket sleep
+                await page.wait_for_function(
+                    "(n) => document.querySelectorAll('a.table-tr.filter-box.joblink').length > n",
+                    arg=prev_count, timeout=10000)
                 return True
             
             return False
@@ -1,8 +1,49 @@
-from typing import List, Dict
+from typing import AsyncIterator, List, Dict
 from .base_extractor import BaseExtractor
+from utils import scrape_cache
 import asyncio
 import logging
 
+# Extraction JS at module scope so every page turn reuses one source
+_HCL_JOBS_JS = """
+            (els) => {
+                // Filter out non-job entries
+                const invalidTitles = [
+                    'saved jobs', 'filter results', 'search', 'previous',
+                    'next', 'load more', 'new job search', 'careers'
+                ];
+
+                return els.map(element => {
+                    const linkElement = element.querySelector('a[data-once="ajaxified-components"]');
+                    if (!linkElement) return null;
+
+                    const title = linkElement.textContent.trim();
+                    const url = new URL(linkElement.getAttribute('href'), window.location.origin).href;
+                    const row = element.closest('tr');
+                    const locationCell = row.querySelector('td[headers="view-field-work-location-table-column"]');
+                    const location = locationCell ? locationCell.textContent.trim() : '';
+
+                    // Validate the entry; rejecting here keeps
+                    // invalid rows off the CDP wire entirely
+                    if (!title ||
+                        !url.includes('/jobs/') ||
+                        invalidTitles.some(invalid => title.toLowerCase().includes(invalid)) ||
+                        title.startsWith('#') ||
+                        title.toLowerCase().startsWith('filter') ||
+                        url.includes('jobsearch') ||
+                        url.includes('saved-jobs')) {
+                        return null;
+                    }
+
+                    return {
+                        title: title,
+                        url: url,
+                        location: location
+                    };
+                }).filter(job => job !== null);
+            }
+        """
+
 class HCLExtractor(BaseExtractor):
     def __init__(self, scraper):
         super().__init__(scraper)
@@ -11,121 +52,94 @@ class HCLExtractor(BaseExtractor):
     async def extract(self, base_url: str, max_pages: int = 2) -> List[Dict]:
         """
         Extract jobs from HCL careers page
-        
+
         Args:
             base_url: Base URL for HCL careers page
             max_pages: Number of times to click "Load more"
         """
+        # Recent result on disk beats a fresh Playwright round-trip
+        cached = scrape_cache.get(base_url, self.cache_ttl_hours)
+        if cached is not None:
+            self.logger.info(f"Using cached jobs for {base_url}")
+            return cached
+        jobs = [job async for job
+                in self.extract_iter(base_url, max_pages=max_pages)]
+        if jobs:
+            scrape_cache.put(base_url, jobs)
+        return jobs
+
+    async def extract_iter(self, base_url: str,
+                           max_pages: int = 2) -> AsyncIterator[Dict]:
+        """Yield HCL jobs batch by batch as "Load more" reveals them
+
+        Streams straight off the wire (no cache read/write, that lives
+        in extract), so a consumer sees each batch before the next
+        click instead of waiting for the whole run.
+        """
+        total = 0
+        page = None
         try:
-            # Create new page using browser context
-            context = await self.scraper.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            page = await context.new_page()
-            all_jobs = []
-            
-            # Load initial page
-            await page.goto(base_url, wait_until='networkidle')
-            await page.wait_for_selector('td[headers="view-field-designation-table-column"]')
-            
+            # Shared context: viewport/UA/resource blocking preset, HTTP
+            # connections and DNS cache reused across extractors
+            page = await self.scraper.get_page()
+
+            # Load initial page, waiting only for the job table itself
+            # rather than networkidle
+            await page.goto(base_url, wait_until='commit')
+            await page.wait_for_selector(
+                'td[headers="view-field-designation-table-column"]',
+                state='attached', timeout=15000)
+
             # Click "Load more" button max_pages times
             for click_count in range(max_pages):
                 # Extract current page jobs
                 jobs = await self.extract_jobs_from_page(page)
-                all_jobs.extend(jobs)
-                
+                for job in jobs:
+                    total += 1
+                    yield job
+
                 if click_count < max_pages - 1:  # Don't click after last page
                     # Find and click "Load more" button
                     load_more = await page.query_selector('a.button.btn.default-34[title="Load more items"]')
                     if not load_more:
                         self.logger.info("No more jobs to load")
                         break
-                        
-                    # Get current job count for verification
-                    current_count = len(all_jobs)
-                    
-                    # Click and wait for new content
+
+                    # "Load more" only appends rows via AJAX, so wait for
+                    # the row count to grow past the pre-click snapshot —
+                    # networkidle plus a hard sleep paid several seconds
+                    # for what is really one short XHR
+                    prev = await page.locator(
+                        'td[headers="view-field-designation-table-column"]').count()
                     await load_more.click()
-                    await page.wait_for_load_state('networkidle')
-                    await asyncio.sleep(2)  # Wait for content to load
-                    
-                    # Verify new content loaded
-                    await page.wait_for_selector('td[headers="view-field-designation-table-column"]')
-                    
+                    await page.wait_for_function(
+                        "document.querySelectorAll("
+                        "'td[headers=\"view-field-designation-table-column\"]')"
+                        f".length > {prev}",
+                        timeout=10000)
+
                     self.logger.info(f"Clicked 'Load more' button ({click_count + 1}/{max_pages})")
 
-            await page.close()
-            self.logger.info(f"Total jobs found: {len(all_jobs)}")
-            return all_jobs
+            self.logger.info(f"Total jobs found: {total}")
 
         except Exception as e:
             self.logger.error(f"Error extracting HCL jobs: {str(e)}")
-            if 'page' in locals():
+        finally:
+            if page is not None:
                 await page.close()
-            return []
 
     async def extract_jobs_from_page(self, page) -> List[Dict]:
         """Extract jobs from current page content"""
         try:
-            jobs = await page.evaluate("""
-                () => {
-                    const jobs = [];
-                    
-                    // HCL selectors
-                    const hclElements = document.querySelectorAll('td[headers="view-field-designation-table-column"]');
-                    
-                    // Accenture selectors
-                    const accentureElements = document.querySelectorAll('a.cmp-teaser__title-link');
-                    
-                    // Process HCL jobs
-                    hclElements.forEach(element => {
-                        const linkElement = element.querySelector('a[data-once="ajaxified-components"]');
-                        if (linkElement) {
-                            const title = linkElement.textContent.trim();
-                            const url = new URL(linkElement.getAttribute('href'), window.location.origin).href;
-                            const row = element.closest('tr');
-                            const locationCell = row.querySelector('td[headers="view-field-work-location-table-column"]');
-                            const location = locationCell ? locationCell.textContent.trim() : '';
-                            
-                            // Filter out non-job entries
-                            const invalidTitles = [
-                                'saved jobs', 'filter results', 'search', 'previous', 
-                                'next', 'load more', 'new job search', 'careers'
-                            ];
-                            
-                            // Validate the entry
-                            if (title && 
-                                url.includes('/jobs/') && 
-                                !invalidTitles.some(invalid => title.toLowerCase().includes(invalid)) &&
-                                !url.includes('jobsearch') &&
-                                !url.includes('saved-jobs')) {
-                                
-                                jobs.push({
-                                    title: title,
-                                    url: url,
-                                    location: location
-                                });
-                            }
-                        }
-                    });
-                    
-                    return jobs;
-                }
-            """)
-            
-            # Additional Python-side filtering
-            filtered_jobs = [
-                job for job in jobs
-                if (job.get('title') and 
-                    job.get('url') and 
-                    not job['title'].startswith('#') and
-                    not job['title'].lower().startswith('filter') and
-                    len(job['title'].strip()) > 0)
-            ]
-            
-            self.logger.info(f"Found {len(filtered_jobs)} valid jobs on current page")
-            return filtered_jobs
+            # evaluate_all hands the matched cells to one JS callback, so
+            # the table is read in a single batched round-trip and only
+            # the mapped fields cross the CDP wire
+            jobs = await page.locator(
+                'td[headers="view-field-designation-table-column"]'
+            ).evaluate_all(_HCL_JOBS_JS)
+
+            self.logger.info(f"Found {len(jobs)} valid jobs on current page")
+            return jobs
             
         except Exception as e:
             self.logger.error(f"Error extracting jobs from page: {str(e)}")
@@ -144,9 +158,16 @@ class HCLExtractor(BaseExtractor):
             # Try HCL load more button
             load_more = await page.query_selector('a.button.btn.default-34[title="Load more items"]')
             if load_more and await load_more.is_visible():
+                # Same row-count wait as the extract loop: the button
+                # appends rows in place, there is no navigation to idle on
+                prev = await page.locator(
+                    'td[headers="view-field-designation-table-column"]').count()
                 await load_more.click()
-                await page.wait_for_load_state('networkidle')
-                await asyncio.sleep(2)
+                await page.wait_for_function(
+                    "document.querySelectorAll("
+                    "'td[headers=\"view-field-designation-table-column\"]')"
+                    f".length > {prev}",
+                    timeout=10000)
                 return True
             
             return False
@@ -1,9 +1,63 @@
 from typing import List, Dict
 from .base_extractor import BaseExtractor
+from utils import scrape_cache
+import aiohttp
 import asyncio
 import logging
 
+# Extraction JS at module scope so every page turn reuses one source
+_IBM_JOBS_JS = """
+            (els) => {
+                // Filter out non-job entries
+                const invalidTitles = [
+                    'saved jobs', 'filter', 'search', 'previous',
+                    'next', 'load more', 'new job search', 'careers'
+                ];
+
+                return els.map(element => {
+                    const title = element.querySelector('.bx--card__heading')?.textContent.trim();
+                    const url = element.href || element.getAttribute('href');
+                    const category = element.querySelector('.bx--card__eyebrow')?.textContent.trim() || '';
+                    const locationElement = element.querySelector('.ibm--card__copy__inner');
+                    let location = '';
+
+                    if (locationElement) {
+                        const locationText = locationElement.textContent.trim();
+                        const locationParts = locationText.split('\\n');
+                        location = locationParts.length > 1 ? locationParts[1].trim() : locationText;
+                    }
+
+                    // Validate the entry; rejecting here keeps
+                    // invalid rows off the CDP wire entirely
+                    if (!title ||
+                        !url ||
+                        invalidTitles.some(invalid => title.toLowerCase().includes(invalid)) ||
+                        title.startsWith('#') ||
+                        title.toLowerCase().startsWith('filter')) {
+                        return null;
+                    }
+
+                    // Ensure URL is absolute
+                    const fullUrl = url.startsWith('http') ? url :
+                                  new URL(url, 'https://careers.ibm.com').href;
+
+                    return {
+                        title: title,
+                        url: fullUrl,
+                        location: location,
+                        category: category,
+                        company: 'IBM'
+                    };
+                }).filter(job => job !== null);
+            }
+        """
+
 class IBMExtractor(BaseExtractor):
+    # Search API that backs the careers page; the rendered JS calls the
+    # same endpoint, so hitting it directly skips the browser render
+    API_URL = 'https://www-api.ibm.com/search/api/v2'
+    API_PAGE_SIZE = 30
+
     def __init__(self, scraper):
         super().__init__(scraper)
         self.logger = logging.getLogger(__name__)
@@ -11,40 +65,114 @@ class IBMExtractor(BaseExtractor):
     async def extract(self, base_url: str, max_pages: int = 2) -> List[Dict]:
         """
         Extract jobs from IBM careers page
-        
+
+        Tries the JSON search API first (no browser render, pages fetched
+        concurrently) and falls back to Playwright when the API call or
+        its parse fails.
+
         Args:
             base_url: Base URL for IBM careers page
             max_pages: Number of pages to scrape
         """
+        # Recent result on disk beats both the API call and the browser
+        cached = scrape_cache.get(base_url, self.cache_ttl_hours)
+        if cached is not None:
+            self.logger.info(f"Using cached jobs for {base_url}")
+            return cached
+
+        try:
+            jobs = await self._api_extract(max_pages)
+            if jobs:
+                self.logger.info(f"Total jobs found via API: {len(jobs)}")
+                scrape_cache.put(base_url, jobs)
+                return jobs
+        except Exception as e:
+            self.logger.warning(f"IBM API extract failed ({e}); using browser")
+        jobs = await self._browser_extract(base_url, max_pages)
+        if jobs:
+            scrape_cache.put(base_url, jobs)
+        return jobs
+
+    async def _api_extract(self, max_pages: int) -> List[Dict]:
+        """Fetch jobs straight from the careers search API"""
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Content-Type': 'application/json',
+        }
+        timeout = aiohttp.ClientTimeout(total=20)
+        async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
+            async def fetch(page_index):
+                payload = {
+                    'appId': 'careers',
+                    'scopes': ['careers'],
+                    'query': {'bool': {'must': []}},
+                    'size': self.API_PAGE_SIZE,
+                    'from': page_index * self.API_PAGE_SIZE,
+                }
+                async with session.post(self.API_URL, json=payload) as response:
+                    response.raise_for_status()
+                    return await response.json()
+
+            pages = await asyncio.gather(
+                *[fetch(n) for n in range(max_pages)])
+
+        jobs = []
+        seen_urls = set()
+        for data in pages:
+            for hit in data.get('hits', {}).get('hits', []):
+                source = hit.get('_source', {})
+                title = (source.get('title') or '').strip()
+                url = source.get('url') or ''
+                location = (source.get('field_keyword_05')
+                            or source.get('location') or '')
+                if isinstance(location, list):
+                    location = ', '.join(location)
+                if not title or not url or url in seen_urls:
+                    continue
+                seen_urls.add(url)
+                jobs.append({
+                    'title': title,
+                    'url': url,
+                    'location': location,
+                    'category': source.get('category', ''),
+                    'company': 'IBM'
+                })
+        return jobs
+
+    async def _browser_extract(self, base_url: str, max_pages: int = 2) -> List[Dict]:
+        """Playwright fallback used when the search API is unavailable"""
         try:
-            # Create new page using browser context with additional options
-            context = await self.scraper.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                ignore_https_errors=True  # Added to handle SSL issues
-            )
-            page = await context.new_page()
+            # Shared context: viewport/UA/resource blocking preset (and
+            # ignore_https_errors, which this site needed), HTTP
+            # connections and DNS cache reused across extractors
+            page = await self.scraper.get_page()
             all_jobs = []
             
             # Update base URL to the correct IBM careers URL
             corrected_url = "https://www.ibm.com/in-en/careers/search?field_keyword_17[0]=Remote&field_keyword_05[0]=India"
             
-            # Load initial page with longer timeout and retry logic
+            # Load initial page, waiting only for the job cards rather
+            # than networkidle plus a blanket sleep
             try:
-                await page.goto(corrected_url, 
-                              wait_until='networkidle',
+                await page.goto(corrected_url,
+                              wait_until='commit',
                               timeout=60000)  # Increased timeout
-                await asyncio.sleep(5)  # Longer wait for dynamic content
-                
-                # Wait for job cards with retry
-                for _ in range(3):  # Retry up to 3 times
+
+                # Wait for job cards with capped exponential backoff:
+                # wait_for_function returns the instant a card exists,
+                # and the growing timeouts (5s/10s/15s) give up in ~32s
+                # worst case instead of the old fixed 20s-per-try ~64s
+                for attempt in range(3):
                     try:
-                        await page.wait_for_selector('.bx--card-group__card', timeout=20000)
+                        await page.wait_for_function(
+                            "document.querySelectorAll('.bx--card-group__card').length > 0",
+                            timeout=5000 * (attempt + 1))
                         break
-                    except:
-                        await asyncio.sleep(2)
-                        continue
-                
+                    except Exception:
+                        if attempt == 2:
+                            raise
+                        await asyncio.sleep(0.5 * (2 ** attempt))
+
             except Exception as e:
                 self.logger.error(f"Error loading initial page: {str(e)}")
                 await page.close()
@@ -63,9 +191,10 @@ class IBMExtractor(BaseExtractor):
                         self.logger.info("No more pages available")
                         break
                     
-                    await asyncio.sleep(3)  # Wait for content to load
+                    # wait_for_selector alone is enough; the old blind
+                    # sleep(3) just added latency after the cards arrived
                     await page.wait_for_selector('.bx--card-group__card')
-                    
+
                     self.logger.info(f"Navigated to page {current_page + 2}/{max_pages}")
 
             await page.close()
@@ -84,69 +213,14 @@ class IBMExtractor(BaseExtractor):
             # Wait for job cards to be visible
             await page.wait_for_selector('.bx--card-group__card', timeout=30000)
             
-            jobs = await page.evaluate("""
-                () => {
-                    const jobs = [];
-                    
-                    // IBM job selectors
-                    document.querySelectorAll('.bx--card-group__card').forEach(element => {
-                        try {
-                            const title = element.querySelector('.bx--card__heading')?.textContent.trim();
-                            const url = element.href || element.getAttribute('href');
-                            const category = element.querySelector('.bx--card__eyebrow')?.textContent.trim() || '';
-                            const locationElement = element.querySelector('.ibm--card__copy__inner');
-                            let location = '';
-                            
-                            if (locationElement) {
-                                const locationText = locationElement.textContent.trim();
-                                const locationParts = locationText.split('\\n');
-                                location = locationParts.length > 1 ? locationParts[1].trim() : locationText;
-                            }
-                            
-                            // Filter out non-job entries
-                            const invalidTitles = [
-                                'saved jobs', 'filter', 'search', 'previous', 
-                                'next', 'load more', 'new job search', 'careers'
-                            ];
-                            
-                            // Validate the entry
-                            if (title && 
-                                url && 
-                                !invalidTitles.some(invalid => title.toLowerCase().includes(invalid))) {
-                                
-                                // Ensure URL is absolute
-                                const fullUrl = url.startsWith('http') ? url : 
-                                              new URL(url, 'https://careers.ibm.com').href;
-                                
-                                jobs.push({
-                                    title: title,
-                                    url: fullUrl,
-                                    location: location,
-                                    category: category,
-                                    company: 'IBM'
-                                });
-                            }
-                        } catch (e) {
-                            console.error('Error processing job element:', e);
-                        }
-                    });
-                    
-                    return jobs;
-                }
-            """)
-            
-            # Additional Python-side filtering
-            filtered_jobs = [
-                job for job in jobs
-                if (job.get('title') and 
-                    job.get('url') and 
-                    not job['title'].startswith('#') and
-                    not job['title'].lower().startswith('filter') and
-                    len(job['title'].strip()) > 0)
-            ]
-            
-            self.logger.info(f"Found {len(filtered_jobs)} valid jobs on current page")
-            return filtered_jobs
+            # evaluate_all hands the matched elements to one JS callback,
+            # so the card list is read in a single batched round-trip and
+            # only the mapped fields cross the CDP wire
+            jobs = await page.locator(
+                '.bx--card-group__card').evaluate_all(_IBM_JOBS_JS)
+
+            self.logger.info(f"Found {len(jobs)} valid jobs on current page")
+            return jobs
             
         except Exception as e:
             self.logger.error(f"Error extracting jobs from page: {str(e)}")
@@ -164,9 +238,8 @@ class IBMExtractor(BaseExtractor):
                 next_button = await page.query_selector(selector)
                 if next_button and await next_button.is_visible():
                     await next_button.click()
-                    await page.wait_for_load_state('networkidle')
-                    await asyncio.sleep(2)
-                    # Verify new content loaded
+                    # The cards reappearing are the readiness signal;
+                    # networkidle plus a fixed sleep only added latency
                     await page.wait_for_selector('.bx--card-group__card')
                     return True
             
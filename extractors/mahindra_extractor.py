@@ -2,6 +2,18 @@ from typing import List, Dict
 from .base_extractor import BaseExtractor
 import asyncio
 import logging
+import re
+
+# Compiled once at import; matches titles the post-filter rejects
+_INVALID_TITLE_RE = re.compile(r'#|filter', re.IGNORECASE)
+
+def _valid_job(job, _invalid=_INVALID_TITLE_RE):
+    """Post-filter predicate; reads each field once per row"""
+    title = job.get('title')
+    if not title or not job.get('url'):
+        return False
+    title = title.strip()
+    return bool(title) and not _invalid.match(title)
 
 class MahindraExtractor(BaseExtractor):
     def __init__(self, scraper):
@@ -17,84 +29,102 @@ class MahindraExtractor(BaseExtractor):
             max_pages: Maximum number of pages to scrape
         """
         try:
-            # Create new page using browser context
-            context = await self.scraper.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            # Pagination is URL-driven (startrow=N, 10 rows per page), so
+            # every page is known up front and fetches concurrently in
+            # its own tab instead of clicking through serially
+            semaphore = asyncio.Semaphore(3)  # Don't flood the site
+            results = await asyncio.gather(
+                *[self._scrape_page(base_url, idx, semaphore)
+                  for idx in range(max_pages)],
+                return_exceptions=True
             )
-            page = await context.new_page()
+
             all_jobs = []
-            
-            # Load initial page with increased timeout
-            try:
-                await page.goto(base_url, 
-                              wait_until='networkidle',
-                              timeout=60000)  # Increased timeout to 60 seconds
-                await asyncio.sleep(5)  # Additional wait for content
-                await page.wait_for_selector('.jobTitle-link', timeout=60000)
-            except Exception as e:
-                self.logger.error(f"Error loading page: {str(e)}")
-                await page.close()
-                return []
-            
-            # Extract jobs from each page
-            for current_page in range(max_pages):
-                # Extract current page jobs
-                jobs = await self.extract_jobs_from_page(page)
-                all_jobs.extend(jobs)
-                
-                if current_page < max_pages - 1:  # Don't navigate after last page
-                    # Try to go to next page
-                    has_next = await self.try_next_page(page)
-                    if not has_next:
-                        self.logger.info("No more pages available")
-                        break
-                    
-                    await asyncio.sleep(3)  # Wait for content to load
-                    await page.wait_for_selector('.jobTitle-link', timeout=30000)
-                    
-                    self.logger.info(f"Navigated to page {current_page + 2}/{max_pages}")
-
-            await page.close()
+            for idx, result in enumerate(results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Error fetching page {idx + 1}: {result}")
+                    continue
+                all_jobs.extend(result)
+
             self.logger.info(f"Total jobs found: {len(all_jobs)}")
             return all_jobs
 
         except Exception as e:
             self.logger.error(f"Error extracting Mahindra jobs: {str(e)}")
-            if 'page' in locals():
-                await page.close()
             return []
 
+    async def goto_page(self, page, base_url: str, page_idx: int):
+        """Navigate straight to a startrow page by computed URL
+
+        The old try_next_page read the active pager entry with an
+        evaluate, queried for a matching link and clicked it — three
+        CDP round-trips plus a networkidle wait for a URL that is
+        computable from the page index.
+        """
+        if page_idx == 0:
+            url = base_url
+        else:
+            sep = '&' if '?' in base_url else '?'
+            url = f"{base_url}{sep}startrow={page_idx * 10}"
+        # The job-link selector is the real readiness signal;
+        # networkidle plus a blind sleep stalled on telemetry
+        await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+        await page.wait_for_selector('.jobTitle-link', timeout=60000)
+
+    async def _scrape_page(self, base_url: str, page_idx: int,
+                           semaphore) -> List[Dict]:
+        """Fetch and extract one page in its own tab"""
+        async with semaphore:
+            async with self.scraper.page() as page:
+                await self.goto_page(page, base_url, page_idx)
+                return await self.extract_jobs_from_page(page)
+
     async def extract_jobs_from_page(self, page) -> List[Dict]:
         """Extract jobs from current page content"""
         try:
             jobs = await page.evaluate("""
                 () => {
                     const jobs = [];
-                    
-                    // Mahindra job selectors
-                    document.querySelectorAll('.jobTitle-link').forEach(element => {
+
+                    // Filter out non-job entries: one compiled
+                    // case-insensitive scan per title instead of eight
+                    // includes() calls over a lowered copy
+                    const INVALID = /saved jobs|filter|search|previous|next|load more|new job search|careers/i;
+
+                    // One combined query for links and locations instead
+                    // of a per-row querySelector; nodes are grouped back
+                    // to their row so the DOM is walked once
+                    const rows = new Map();
+                    document.querySelectorAll(
+                        '.jobTitle-link, .job-listing-item .job-location'
+                    ).forEach(node => {
+                        const row = node.closest('.job-listing-item') || node;
+                        const entry = rows.get(row) || {};
+                        if (node.matches('.jobTitle-link')) {
+                            entry.link = entry.link || node;
+                        } else {
+                            entry.location = entry.location || node;
+                        }
+                        rows.set(row, entry);
+                    });
+
+                    rows.forEach(entry => {
                         try {
+                            const element = entry.link;
+                            if (!element) return;
                             const title = element.textContent.trim();
                             const url = element.href;
-                            const jobContainer = element.closest('.job-listing-item');
-                            const location = jobContainer?.querySelector('.job-location')?.textContent.trim();
-                            
-                            // Filter out non-job entries
-                            const invalidTitles = [
-                                'saved jobs', 'filter', 'search', 'previous', 
-                                'next', 'load more', 'new job search', 'careers'
-                            ];
-                            
+                            const location = entry.location?.textContent.trim();
+
                             // Validate the entry
-                            if (title && 
-                                url && 
-                                !invalidTitles.some(invalid => title.toLowerCase().includes(invalid))) {
-                                
+                            if (title &&
+                                url &&
+                                !INVALID.test(title)) {
+
                                 // Ensure absolute URL
                                 const baseUrl = 'https://jobs.mahindracareers.com';
                                 const fullUrl = url.startsWith('http') ? url : `${baseUrl}${url}`;
-                                
+
                                 jobs.push({
                                     title: title,
                                     url: fullUrl,
@@ -106,20 +136,13 @@ class MahindraExtractor(BaseExtractor):
                             console.error('Error processing job element:', e);
                         }
                     });
-                    
+
                     return jobs;
                 }
             """)
             
             # Additional Python-side filtering
-            filtered_jobs = [
-                job for job in jobs
-                if (job.get('title') and 
-                    job.get('url') and 
-                    not job['title'].startswith('#') and
-                    not job['title'].lower().startswith('filter') and
-                    len(job['title'].strip()) > 0)
-            ]
+            filtered_jobs = list(filter(_valid_job, jobs))
             
             self.logger.info(f"Found {len(filtered_jobs)} valid jobs on current page")
             return filtered_jobs
@@ -127,31 +150,3 @@ class MahindraExtractor(BaseExtractor):
         except Exception as e:
             self.logger.error(f"Error extracting jobs from page: {str(e)}")
             return []
-
-    async def try_next_page(self, page) -> bool:
-        """Try to navigate to next page using Mahindra's pagination"""
-        try:
-            # Find the current page number
-            current_page = await page.evaluate("""
-                () => {
-                    const activePage = document.querySelector('.pagination li.active a');
-                    return activePage ? parseInt(activePage.getAttribute('title').replace('Page ', '')) : 1;
-                }
-            """)
-            
-            # Calculate next page's startrow value
-            next_startrow = (current_page) * 10
-            
-            # Try to find and click next page link
-            next_page = await page.query_selector(f'a[href*="startrow={next_startrow}"][rel="nofollow"]')
-            if next_page:
-                await next_page.click()
-                await page.wait_for_load_state('networkidle')
-                await asyncio.sleep(3)  # Increased wait time
-                return True
-            
-            return False
-            
-        except Exception as e:
-            self.logger.error(f"Error in pagination: {e}")
-            return False 
\ No newline at end of file
@@ -23,33 +23,29 @@ def extract(scraper, base_url: str) -> List[Dict]:
 class MicrosoftExtractor(BaseExtractor):
     async def extract(self, base_url):
         try:
-            # Navigate to Microsoft careers page
-            page = await self.scraper.browser.new_page()
-            await page.goto(base_url)
-            
-            # Wait for job listings to load
-            await page.wait_for_selector('div[class*="job"]', timeout=60000)
-            
-            # Extract job information
-            jobs = []
-            job_elements = await page.query_selector_all('div[class*="job"]')
-            
-            for job in job_elements:
-                title = await job.query_selector('h3, [class*="title"]')
-                location = await job.query_selector('[class*="location"]')
-                link = await job.query_selector('a')
-                
-                job_data = {
-                    'title': (await title.inner_text() if title else '').strip(),
-                    'location': (await location.inner_text() if location else '').strip(),
-                    'url': await link.get_attribute('href') if link else ''
-                }
-                if job_data['title'] and job_data['url']:
-                    jobs.append(job_data)
-            
-            await page.close()
-            return jobs
-            
+            # Navigate to Microsoft careers page on the shared context;
+            # the page manager closes the page on every exit path
+            async with self.scraper.page() as page:
+                await page.goto(base_url)
+
+                # Wait for job listings to load
+                await page.wait_for_selector('div[class*="job"]', timeout=60000)
+
+                # Extract everything in one evaluate: the old loop paid
+                # several CDP round-trips per job element, this pays one
+                # for the whole page
+                jobs = await page.evaluate("""
+                    () => Array.from(document.querySelectorAll('div[class*="job"]'))
+                        .map(j => ({
+                            title: j.querySelector('h3, [class*="title"]')?.innerText?.trim() || '',
+                            location: j.querySelector('[class*="location"]')?.innerText?.trim() || '',
+                            url: j.querySelector('a')?.href || ''
+                        }))
+                        .filter(x => x.title && x.url)
+                """)
+
+                return jobs
+
         except Exception as e:
             print(f"Error extracting Microsoft jobs: {e}")
             return [] 
\ No newline at end of file
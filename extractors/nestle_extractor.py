@@ -1,7 +1,23 @@
 from typing import List, Dict
+from urllib.parse import urljoin
 from .base_extractor import BaseExtractor
+from bs4 import BeautifulSoup
 import asyncio
 import logging
+import re
+
+# Compiled once at import; matches titles the post-filter rejects
+_INVALID_TITLE_RE = re.compile(r'filter', re.IGNORECASE)
+
+def _valid_job(job, _invalid=_INVALID_TITLE_RE):
+    """Post-filter predicate; reads each field once per row"""
+    title = job.get('title')
+    url = job.get('url')
+    if not title or not url:
+        return False
+    title = title.strip()
+    return (bool(title) and not _invalid.match(title)
+            and 'jobdetails.nestle.com' in url)
 
 class NestleExtractor(BaseExtractor):
     def __init__(self, scraper):
@@ -17,64 +33,55 @@ class NestleExtractor(BaseExtractor):
             max_pages: Maximum number of pages to scrape
         """
         try:
-            context = await self.scraper.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            page = await context.new_page()
-            all_jobs = []
-            
-            # Load initial page with retry mechanism
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    # First wait for initial load
-                    await page.goto(base_url, wait_until='domcontentloaded', timeout=30000)
-                    
-                    # Then wait for network to be idle
-                    await page.wait_for_load_state('networkidle', timeout=30000)
-                    
-                    # Wait for specific content
-                    await page.wait_for_selector('.views-row', timeout=30000)
-                    
-                    # Success - break the retry loop
-                    break
-                    
-                except Exception as e:
-                    self.logger.warning(f"Attempt {attempt + 1} failed: {str(e)}")
-                    if attempt == max_retries - 1:
-                        self.logger.error("All attempts to load page failed")
-                        await page.close()
-                        return []
-                    await asyncio.sleep(5)  # Wait before retrying
-
-            current_page = 1
-            while current_page <= max_pages:
-                self.logger.info(f"Processing page {current_page}")
-                
-                # Extract jobs from current page
-                jobs = await self.extract_jobs_from_page(page)
-                all_jobs.extend(jobs)
-                
-                if current_page >= max_pages:
-                    break
-                
-                # Try to navigate to next page
-                has_next = await self.try_next_page(page)
-                if not has_next:
-                    self.logger.info("No more pages available")
-                    break
-                
-                current_page += 1
-                await asyncio.sleep(3)
-
-            await page.close()
-            return all_jobs
+            # Shared context via the page manager: viewport/UA/resource
+            # blocking preset, and the page is closed on every exit path
+            async with self.scraper.page() as page:
+                all_jobs = []
+
+                # Load initial page with retry mechanism
+                max_retries = 3
+                for attempt in range(max_retries):
+                    try:
+                        # First wait for initial load
+                        await page.goto(base_url, wait_until='domcontentloaded', timeout=30000)
+
+                        # The job rows are the real readiness signal; the
+                        # networkidle leg only waited out telemetry
+                        await page.wait_for_selector('.views-row', timeout=30000)
+
+                        # Success - break the retry loop
+                        break
+
+                    except Exception as e:
+                        self.logger.warning(f"Attempt {attempt + 1} failed: {str(e)}")
+                        if attempt == max_retries - 1:
+                            self.logger.error("All attempts to load page failed")
+                            return []
+                        await asyncio.sleep(5)  # Wait before retrying
+
+                current_page = 1
+                while current_page <= max_pages:
+                    self.logger.info(f"Processing page {current_page}")
+
+                    # Extract jobs from current page
+                    jobs = await self.extract_jobs_from_page(page)
+                    all_jobs.extend(jobs)
+
+                    if current_page >= max_pages:
+                        break
+
+                    # Try to navigate to next page
+                    has_next = await self.try_next_page(page)
+                    if not has_next:
+                        self.logger.info("No more pages available")
+                        break
+
+                    current_page += 1
+
+                return all_jobs
 
         except Exception as e:
             self.logger.error(f"Error extracting Nestle jobs: {str(e)}")
-            if 'page' in locals():
-                await page.close()
             return []
 
     async def extract_jobs_from_page(self, page) -> List[Dict]:
@@ -83,45 +90,31 @@ class NestleExtractor(BaseExtractor):
             # Wait for job listings to be visible
             await page.wait_for_selector('.views-row', timeout=30000)
             
-            jobs = await page.evaluate("""
-                () => {
-                    const jobs = [];
-                    // Look for job links in views-row containers
-                    document.querySelectorAll('.views-row').forEach(row => {
-                        try {
-                            const link = row.querySelector('a[href*="jobdetails.nestle.com/job"]');
-                            if (link) {
-                                const title = link.textContent.trim();
-                                const url = link.href;
-                                const location = row.querySelector('.field--name-field-job-location')?.textContent?.trim() 
-                                            || row.querySelector('.field-location')?.textContent?.trim() 
-                                            || 'India';
-                                
-                                if (title && url && 
-                                    !title.toLowerCase().includes('hundreds of jobs')) {
-                                    jobs.push({
-                                        title: title,
-                                        url: url,
-                                        location: location,
-                                        company: 'Nestle'
-                                    });
-                                }
-                            }
-                        } catch (e) {
-                            console.error('Error processing job row:', e);
-                        }
-                    });
-                    return jobs;
-                }
-            """)
+            # Pull the rendered HTML over CDP as one blob and parse it
+            # in-process with lxml, instead of serializing the job array
+            # out of a page.evaluate call
+            html = await page.content()
+            soup = BeautifulSoup(html, 'lxml')
+            jobs = []
+            for row in soup.select('.views-row'):
+                link = row.select_one('a[href*="jobdetails.nestle.com/job"]')
+                if not link:
+                    continue
+                title = link.get_text(strip=True)
+                url = urljoin(page.url, link.get('href') or '')
+                location_el = (row.select_one('.field--name-field-job-location')
+                               or row.select_one('.field-location'))
+                location = (location_el.get_text(strip=True)
+                            if location_el else 'India')
+                if title and url and 'hundreds of jobs' not in title.lower():
+                    jobs.append({
+                        'title': title,
+                        'url': url,
+                        'location': location or 'India',
+                        'company': 'Nestle'
+                    })
             
-            filtered_jobs = [
-                job for job in jobs
-                if job.get('title') and job.get('url') and
-                not job['title'].lower().startswith('filter') and
-                len(job['title'].strip()) > 0 and
-                'jobdetails.nestle.com' in job['url']
-            ]
+            filtered_jobs = list(filter(_valid_job, jobs))
             
             self.logger.info(f"Found {len(filtered_jobs)} valid jobs on current page")
             return filtered_jobs
@@ -143,9 +136,9 @@ class NestleExtractor(BaseExtractor):
                 next_link = await page.query_selector(selector)
                 if next_link and await next_link.is_visible():
                     await next_link.click()
-                    await page.wait_for_load_state('networkidle', timeout=30000)
+                    # The job rows are the real readiness signal; the
+                    # networkidle leg and the fixed sleep only added latency
                     await page.wait_for_selector('.views-row', timeout=30000)
-                    await asyncio.sleep(3)
                     return True
                     
             return False
@@ -1,5 +1,6 @@
 import asyncio
 import json
+import logging
 import os
 from datetime import datetime
 from utils.scraper import JobScraper
@@ -7,7 +8,66 @@ from utils.excel_generator import ExcelGenerator
 from urllib.parse import urlencode
 from extractors.base_extractor import BaseExtractor
 
+async def scrape_company(company, config, scraper, sem, url_fetches):
+    """Scrape one company and return (company, jobs)
+
+    Runs as one task among many on the shared browser; results are
+    collected by the caller so the Excel file is only written from the
+    main coroutine. The semaphore caps how many companies scrape at
+    once so Chromium memory and remote rate limits stay bounded.
+    url_fetches dedups identical (url, max_pages) scrapes across
+    companies: the first task fetches, the rest await its result.
+    """
+    print(f"Scraping {company}...")
+
+    # Build URL with query parameters
+    base_url = config['base_url']
+    if 'params' in config and 'query' in config['params']:
+        query_string = urlencode(config['params']['query'])
+        full_url = f"{base_url}?{query_string}"
+    else:
+        full_url = base_url
+
+    # Get max pages from config or use default
+    max_pages = config.get('params', {}).get('max_pages', 2)
+
+    # Initialize extractor
+    try:
+        module_path, class_name = config['extractor'].split('.')
+        extractor_module = __import__(f"extractors.{module_path}", fromlist=[class_name])
+        extractor_class = getattr(extractor_module, class_name)
+        extractor = extractor_class(scraper)
+    except (KeyError, ImportError, AttributeError):
+        print(f"No specific extractor found for {company}, using base extractor")
+        extractor = BaseExtractor(scraper)
+
+    print(f"Scraping URL: {full_url}")
+    print(f"Max pages to scrape: {max_pages}")
+
+    # Extract jobs with configured parameters, sharing one fetch per
+    # distinct URL (overlapping ATS domains appear under several
+    # companies in the mapping file)
+    key = (full_url, max_pages)
+    fetch = url_fetches.get(key)
+    if fetch is None:
+        async def run():
+            async with sem:
+                return await extractor.extract(full_url, max_pages=max_pages)
+        fetch = asyncio.ensure_future(run())
+        url_fetches[key] = fetch
+    else:
+        print(f"Reusing fetch for {full_url}")
+    jobs = await fetch
+    # Copy so per-company consumers can't mutate the shared result
+    return company, list(jobs)
+
+
 async def main():
+    # Quiet by default; raise to INFO/DEBUG when diagnosing a site.
+    # f-string log arguments still format eagerly, but the handler and
+    # flush cost of the per-job lines is gone at WARNING
+    logging.basicConfig(level=logging.WARNING)
+
     # Load company configurations
     with open('company_mappings.json', 'r') as f:
         company_mappings = json.load(f)
@@ -18,44 +78,31 @@ async def main():
     excel_gen = ExcelGenerator()
     
     try:
-        # Scrape each company
-        for company, config in company_mappings.items():
-            try:
-                print(f"Scraping {company}...")
-                
-                # Build URL with query parameters
-                base_url = config['base_url']
-                if 'params' in config and 'query' in config['params']:
-                    query_string = urlencode(config['params']['query'])
-                    full_url = f"{base_url}?{query_string}"
-                else:
-                    full_url = base_url
-                
-                # Get max pages from config or use default
-                max_pages = config.get('params', {}).get('max_pages', 2)
-                
-                # Initialize extractor
-                try:
-                    module_path, class_name = config['extractor'].split('.')
-                    extractor_module = __import__(f"extractors.{module_path}", fromlist=[class_name])
-                    extractor_class = getattr(extractor_module, class_name)
-                    extractor = extractor_class(scraper)
-                except (KeyError, ImportError, AttributeError):
-                    print(f"No specific extractor found for {company}, using base extractor")
-                    extractor = BaseExtractor(scraper)
-                
-                print(f"Scraping URL: {full_url}")
-                print(f"Max pages to scrape: {max_pages}")
-                
-                # Extract jobs with configured parameters
-                jobs = await extractor.extract(full_url, max_pages=max_pages)
-                excel_gen.append_jobs(jobs, company)
-                        
-            except Exception as e:
-                print(f"Error processing {company}: {str(e)}")
+        # Scrape all companies concurrently on the one browser: the run
+        # is I/O-bound, so overlapping the per-site network waits takes
+        # wall time from the sum of the sites to roughly the slowest one
+        companies = list(company_mappings.items())
+        # Bounded parallelism: enough tasks to overlap the network waits
+        # without spiking Chromium memory or tripping rate limits
+        sem = asyncio.Semaphore(int(os.getenv('SCRAPE_CONCURRENCY', 8)))
+        url_fetches = {}
+        results = await asyncio.gather(
+            *[scrape_company(company, config, scraper, sem, url_fetches)
+              for company, config in companies],
+            return_exceptions=True
+        )
+
+        # Write results from the main coroutine only, in config order,
+        # so the Excel file never sees concurrent appends
+        for (name, _), result in zip(companies, results):
+            if isinstance(result, Exception):
+                print(f"Error processing {name}: {result}")
                 continue
-    
+            company, jobs = result
+            excel_gen.append_jobs(jobs, company)
+
     finally:
+        excel_gen.finalize()
         await scraper.close()
 
 if __name__ == "__main__":
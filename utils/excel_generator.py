@@ -1,8 +1,8 @@
-import pandas as pd
 import os
 from datetime import datetime
 from typing import List, Dict
 import csv
+from openpyxl import Workbook
 
 class ExcelGenerator:
     def __init__(self):
@@ -14,11 +14,13 @@ class ExcelGenerator:
         self.csv_file = f'{self.output_dir}/all_jobs_{self.timestamp}.csv'
         self.excel_file = f'{self.output_dir}/all_jobs_{self.timestamp}.xlsx'
         
-        # Initialize CSV with headers
+        # Initialize CSV with headers; one handle and writer for the
+        # whole run instead of reopen-and-rebuild per append
         self.headers = ['company', 'title', 'location', 'url', 'job_id', 'timestamp', 'source']
-        with open(self.csv_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=self.headers)
-            writer.writeheader()
+        self._csv_fp = open(self.csv_file, 'w', newline='',
+                            encoding='utf-8', buffering=1 << 20)
+        self._writer = csv.DictWriter(self._csv_fp, fieldnames=self.headers)
+        self._writer.writeheader()
 
     def append_jobs(self, jobs: List[Dict], company: str):
         """
@@ -29,31 +31,55 @@ class ExcelGenerator:
             company: Company name
         """
         try:
-            # Append to CSV
-            with open(self.csv_file, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=self.headers)
-                for job in jobs:
-                    job_data = {
-                        'company': company,
-                        'title': job.get('title', ''),
-                        'location': job.get('location', ''),
-                        'url': job.get('url', ''),
-                        'job_id': job.get('job_id', ''),
-                        'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        'source': job.get('source', company)
-                    }
-                    writer.writerow(job_data)
-
-            # Convert CSV to Excel
-            df = pd.read_csv(self.csv_file)
-            df.to_excel(self.excel_file, index=False, engine='openpyxl')
-            
+            # Append to CSV through the persistent writer in one
+            # writerows call; the timestamp is the same for the whole
+            # batch, so format it once instead of per row
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            rows = [{
+                'company': company,
+                'title': job.get('title', ''),
+                'location': job.get('location', ''),
+                'url': job.get('url', ''),
+                'job_id': job.get('job_id', ''),
+                'timestamp': now,
+                'source': job.get('source', company)
+            } for job in jobs]
+            self._writer.writerows(rows)
+            # Flush so a crash mid-run still leaves the rows on disk
+            self._csv_fp.flush()
+
             print(f"Added {len(jobs)} jobs from {company}")
-            print(f"Updated files: \n- {self.csv_file}\n- {self.excel_file}")
-            
+
         except Exception as e:
             print(f"Error appending jobs for {company}: {e}")
 
+    def finalize(self):
+        """Write the Excel file once from the accumulated CSV
+
+        append_jobs used to rebuild the whole xlsx via pandas after every
+        company, serializing all prior rows again each call; streaming
+        the finished CSV through a write-only workbook at the end does
+        one pass over the data total.
+        """
+        self.close()
+        try:
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet()
+            with open(self.csv_file, newline='', encoding='utf-8') as f:
+                for row in csv.reader(f):
+                    ws.append(row)
+            wb.save(self.excel_file)
+            print(f"Generated files: \n- {self.csv_file}\n- {self.excel_file}")
+        except Exception as e:
+            print(f"Error writing Excel file: {e}")
+
+    def close(self):
+        """Flush and close the CSV handle (safe to call twice)"""
+        if self._csv_fp is not None:
+            self._csv_fp.close()
+            self._csv_fp = None
+            self._writer = None
+
     def get_file_paths(self):
         """Return paths to the generated files"""
         return {
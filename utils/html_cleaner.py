@@ -1,27 +1,35 @@
 import re
-from bs4 import BeautifulSoup
+
+try:
+    # lexbor is a C parser; on large career pages it is orders of
+    # magnitude faster than BeautifulSoup's pure-Python html.parser
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+    from bs4 import BeautifulSoup
+
+# Compiled once; one C-level pass normalizes all whitespace runs
+_WS = re.compile(r'\s+')
 
 def clean_html(html: str) -> str:
     """
     Clean HTML content by removing unnecessary whitespace and tags
-    
+
     Args:
         html: Raw HTML content
-        
+
     Returns:
         Cleaned HTML content
     """
-    # Remove script and style elements
-    soup = BeautifulSoup(html, 'html.parser')
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+        for tag in tree.css('script, style'):
+            tag.decompose()
+        text = tree.body.text(separator=' ') if tree.body else ''
+        return _WS.sub(' ', text).strip()
+
+    # Fallback: BeautifulSoup on the lxml C parser
+    soup = BeautifulSoup(html, 'lxml')
     for script in soup(["script", "style"]):
         script.decompose()
-    
-    # Get text
-    text = soup.get_text()
-    
-    # Remove extra whitespace
-    lines = (line.strip() for line in text.splitlines())
-    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-    text = ' '.join(chunk for chunk in chunks if chunk)
-    
-    return text 
\ No newline at end of file
+    return _WS.sub(' ', soup.get_text(separator=' ')).strip()
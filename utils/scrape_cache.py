@@ -0,0 +1,48 @@
+import hashlib
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+CACHE_DIR = os.path.join('data', 'scrape_cache')
+DEFAULT_TTL_HOURS = 6
+
+
+def _cache_path(url: str) -> str:
+    return os.path.join(
+        CACHE_DIR, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json')
+
+
+def get(url: str, ttl_hours: float = DEFAULT_TTL_HOURS) -> Optional[List[Dict]]:
+    """
+    Return cached jobs for a URL, or None on miss/expiry
+
+    Args:
+        url: Scraped URL the jobs were extracted from
+        ttl_hours: Maximum age of the cache entry in hours
+    """
+    try:
+        with open(_cache_path(url), 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        cached_at = datetime.fromisoformat(entry['ts'])
+        if datetime.now() - cached_at > timedelta(hours=ttl_hours):
+            return None
+        return entry['jobs']
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def put(url: str, jobs: List[Dict]) -> None:
+    """
+    Store scraped jobs for a URL with the current timestamp
+
+    Args:
+        url: Scraped URL the jobs were extracted from
+        jobs: List of job dictionaries to cache
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(_cache_path(url), 'w', encoding='utf-8') as f:
+            json.dump({'ts': datetime.now().isoformat(), 'jobs': jobs}, f)
+    except OSError as e:
+        print(f"Error writing scrape cache: {e}")